@@ -18,6 +18,7 @@
 
 import argparse
 import json
+import os
 
 from PIL import Image
 import tempfile
@@ -203,6 +204,7 @@ def get_status(printer):
 
 
 def print_jpeg(printer, use_lock, mode, cut, jpeg_file, wait_after_print):
+    """Print a JPEG (or convertible image) file, returns True if it was sent"""
     _get_configuration_and_display_connection(printer)
     status = printer.get_status()
 
@@ -222,6 +224,9 @@ def print_jpeg(printer, use_lock, mode, cut, jpeg_file, wait_after_print):
             % (lock.comment, lock.job_number)
         )
 
+    # Temporary JPEG converted from another image type, removed when done
+    converted = None
+
     try:
         if use_lock:
             job_status = printer.get_job_status()
@@ -238,16 +243,17 @@ def print_jpeg(printer, use_lock, mode, cut, jpeg_file, wait_after_print):
         if file_type.startswith("image/") and not file_type == "image/jpeg":
             print("Is %s but not jpeg, try convert" % file_type)
             try:
-                with tempfile.NamedTemporaryFile() as tmp:
-                    im1 = Image.open(jpeg_file.name)
-                    imX = im1.convert("RGB")
-                    pathName = tmp.name + ".jpg"
-                    imX.save(pathName)
-
-                    jpeg_file = open(pathName, "rb")
-                    old_file_type = file_type
-                    file_type = mimetypes.guess_type(jpeg_file.name)[0]
-                    print("%s convert to %s" % (old_file_type, file_type))
+                fd, pathName = tempfile.mkstemp(suffix=".jpg")
+                os.close(fd)
+                converted = pathName
+                im1 = Image.open(jpeg_file.name)
+                imX = im1.convert("RGB")
+                imX.save(pathName)
+
+                jpeg_file = open(pathName, "rb")
+                old_file_type = file_type
+                file_type = mimetypes.guess_type(jpeg_file.name)[0]
+                print("%s convert to %s" % (old_file_type, file_type))
             except Exception:
                 print("fail for convert to jpg, ")
 
@@ -256,10 +262,16 @@ def print_jpeg(printer, use_lock, mode, cut, jpeg_file, wait_after_print):
             if wait_after_print:
                 printer.wait_to_turn_idle()
             print("PRINT OK")
+            return True
         else:
             print("not a JPEG file")
             print("PRINT FAILED")
+            return False
     finally:
+        if converted is not None:
+            if jpeg_file.name == converted:
+                jpeg_file.close()
+            os.unlink(converted)
         if use_lock:
             print("Releasing lock for job %s..." % lock.job_number)
             printer.release()
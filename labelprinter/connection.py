@@ -124,5 +124,18 @@ class Connection:
         finally:
             self._socket.settimeout(self._timeout_standard)
 
+    def is_alive(self):
+        # Peek without blocking: no data pending means the peer is still
+        # there, an empty read means it closed the connection
+        try:
+            self._socket.settimeout(0)
+            return bool(self._socket.recv(1, socket.MSG_PEEK))
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+        finally:
+            self._socket.settimeout(self._timeout_standard)
+
     def close(self):
         self._socket.close()
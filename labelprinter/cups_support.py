@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+pycups import shared by the CUPS queue tools
+
+Kept apart from the tools themselves, so that label-queue doesn't load
+the worker just to get at pycups.
+"""
+
+import sys
+
+
+def import_cups():
+    """
+    Import pycups on first use, show helpful error if not installed
+
+    Deferred so that `--help` and argument errors work without pycups.
+    """
+    try:
+        import cups  # type: ignore[import-not-found]
+    except ImportError:
+        print("ERROR: pycups is not installed", file=sys.stderr)
+        print("\nCUPS queue mode requires the pycups library.", file=sys.stderr)
+        print("Install it with:", file=sys.stderr)
+        print("  uv tool install --with pycups labelprinter", file=sys.stderr)
+        print("  # or", file=sys.stderr)
+        print("  pip install pycups", file=sys.stderr)
+        sys.exit(1)
+
+    return cups
@@ -4,20 +4,24 @@ Text to label printer for Brother VC-500W
 Creates JPEG images from text and prints them
 """
 
-import argparse
+import copy
+import functools
 import json
-import subprocess
 import os
 import sys
 import time
 from pathlib import Path
 
-# Import printer communication classes for tape detection
-from labelprinter.connection import Connection
-from labelprinter.printer import LabelPrinter
-
 CONFIG_FILE = Path.home() / ".config" / "labelprinter" / "config.json"
 
+# Previously rendered labels, keyed on the text and render settings
+RENDER_CACHE_DIR = Path.home() / ".cache" / "labelprinter" / "images"
+# Bump when rendering changes, so old cached images are no longer used
+RENDER_CACHE_VERSION = 1
+
+# Font files fc-match found for configured fonts that are not files
+FONT_CACHE_FILE = Path.home() / ".cache" / "labelprinter" / "fonts.json"
+
 # Tape width detection mapping
 # Some printers report slightly different widths than the actual tape width
 # This maps detected widths to canonical widths
@@ -53,7 +57,6 @@ def get_adjusted_font_size(config):
 def create_image_file(text):
     """Create a file path for the image in a dedicated directory"""
     import tempfile
-    from pathlib import Path
 
     # Create dedicated directory for label images
     labels_dir = Path.home() / ".local" / "share" / "labelprinter" / "images"
@@ -61,30 +64,27 @@ def create_image_file(text):
 
     # Create temporary file in the labels directory
     fd, path = tempfile.mkstemp(suffix=".jpg", dir=str(labels_dir))
-    import os
-
     os.close(fd)  # Close the file descriptor, we just need the path
 
     return path
 
 
-def try_pil_image_creation(text, config, tmp_path, debug):
-    """Try to create image using PIL/Pillow"""
+def try_pil_image_creation(text, config, tmp_path, dimensions, debug):
+    """Try to create image using PIL/Pillow
+
+    dimensions is the result of calculate_minimal_image_dimensions, which
+    create_text_image has already measured the text for.
+    """
     try:
         from PIL import Image, ImageDraw
 
-        # Get dimensions (already calculated in create_text_image)
-        width, height, text_width, text_height, bbox = (
-            calculate_minimal_image_dimensions(text, config)
-        )
+        # Draw with the same font the text was measured with
+        width, height, text_width, text_height, bbox, font = dimensions
 
         # Create white image
         image = Image.new("RGB", (width, height), "white")
         draw = ImageDraw.Draw(image)
 
-        # Load font
-        font = load_font_for_measurement(config.get("font"), config["font_size"])
-
         # Calculate text position
         font_size = get_adjusted_font_size(config)
         left_padding = int(font_size * 1.2)  # ~2 character widths
@@ -156,16 +156,39 @@ def get_default_config():
     }
 
 
+@functools.lru_cache(maxsize=4)
+def _read_config_file(path, inode, size, mtime_ns):
+    """Parse a config file, cached until the file is replaced or changes
+
+    save_config renames a new file into place, so the inode catches
+    rewrites within the filesystem's mtime granularity.
+    """
+    # The config is tiny, so read it in one call without the buffered
+    # text file machinery of open()
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+    return json.loads(data)
+
+
 def load_config():
     """Load printer configuration with defaults and migration"""
     default_config = get_default_config()
 
-    if not CONFIG_FILE.exists():
+    try:
+        st = CONFIG_FILE.stat()
+    except OSError:
         return create_default_config(default_config)
 
     try:
-        with open(CONFIG_FILE, "r") as f:
-            user_config = json.load(f)
+        # Callers modify the config they get, so never hand out the
+        # cached copy itself
+        user_config = copy.deepcopy(
+            _read_config_file(CONFIG_FILE, st.st_ino, st.st_size, st.st_mtime_ns)
+        )
 
         # Check if migration is needed before loading
         needs_migration = "tape_presets" not in user_config
@@ -173,15 +196,17 @@ def load_config():
         # Migrate legacy config format if needed
         user_config = migrate_legacy_config(user_config)
 
-        # Merge with defaults (user config takes precedence)
-        merged_config = {**default_config, **user_config}
+        # Merge onto the defaults in place (user config takes precedence)
+        default_font = default_config["font"]
+        merged_config = default_config
+        merged_config.update(user_config)
 
         # Update deprecated font values
         if merged_config.get("font") in ["Arial", "DejaVu-Sans"]:
-            merged_config["font"] = default_config["font"]
-            save_config(merged_config)
+            merged_config["font"] = default_font
 
-        # Save config if it was migrated or changed
+        # Save config if it was migrated or changed, a single write covers
+        # the font update too
         if needs_migration or user_config != merged_config:
             save_config(merged_config)
 
@@ -189,22 +214,39 @@ def load_config():
 
     except (json.JSONDecodeError, OSError):
         print(f"Warning: Could not load config file {CONFIG_FILE}, using defaults")
-        return default_config
+        # default_config may already have the user config merged in
+        return get_default_config()
+
+
+def _ensure_config_dir():
+    """Create the config directory, one mkdir call when it already exists"""
+    try:
+        os.mkdir(CONFIG_FILE.parent)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        # ~/.config itself is missing too
+        CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 
 def create_default_config(config):
     """Create and save default configuration file"""
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_config_dir()
     with open(CONFIG_FILE, "w") as f:
         json.dump(config, f, indent=2)
     return config
 
 
 def save_config(config):
-    """Save configuration to file"""
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    """Save configuration to file
+
+    Writes to a temporary file next to the config and renames it into
+    place, so an interrupted write never leaves a truncated config.
+    """
+    _ensure_config_dir()
+    tmp_file = CONFIG_FILE.with_suffix(".json.tmp")
+    tmp_file.write_text(json.dumps(config, indent=2))
+    os.replace(tmp_file, CONFIG_FILE)
 
 
 def migrate_legacy_config(old_config):
@@ -233,10 +275,13 @@ def migrate_legacy_config(old_config):
 
     # Backup old config
     backup_path = CONFIG_FILE.with_suffix(".json.bak")
-    if not backup_path.exists():
-        with open(backup_path, "w") as f:
+    try:
+        # Exclusive create, so an earlier backup is never overwritten
+        with open(backup_path, "x") as f:
             json.dump(old_config, f, indent=2)
         print(f"   ✓ Backed up old config to {backup_path}")
+    except FileExistsError:
+        pass
 
     # Get default config structure
     new_config = get_default_config()
@@ -310,6 +355,36 @@ def get_preset_for_tape_width(tape_width_mm, config):
     return {"font_size": calculated_font_size}
 
 
+def prefetch_host_lookup(host, port=9100):
+    """
+    Resolve the printer host in the background
+
+    Looking up the printer (often an mDNS .local name) can take a while,
+    so start it while the image renders.
+
+    Returns:
+        Future: the IPv4 address to connect to, None if the lookup failed
+    """
+    import socket
+    import threading
+    from concurrent.futures import Future
+
+    future = Future()
+
+    def resolve():
+        try:
+            addr_info = socket.getaddrinfo(
+                host, port, socket.AF_INET, socket.SOCK_STREAM
+            )
+            future.set_result(addr_info[0][4][0])
+        except (OSError, IndexError):
+            # Connecting by name again reports the problem
+            future.set_result(None)
+
+    threading.Thread(target=resolve, daemon=True).start()
+    return future
+
+
 def detect_tape_width(host, port=9100, timeout=10):
     """
     Detect the tape width from the printer
@@ -319,6 +394,10 @@ def detect_tape_width(host, port=9100, timeout=10):
         - If successful: (width_mm, None)
         - If failed: (None, error_message)
     """
+    # Printer communication classes are only needed for tape detection
+    from labelprinter.connection import Connection
+    from labelprinter.printer import LabelPrinter
+
     connection = None
     try:
         print(f"🔍 Detecting tape width from printer at {host}...")
@@ -366,6 +445,8 @@ def calculate_minimal_image_dimensions(text, config):
     3. Text height should occupy ~1/3 of label width (adjust font_size to ~104)
        - Text is vertically centered with white padding above/below
     4. Text has left padding of ~2 characters (font_size * 1.2)
+
+    Also returns the font the text was measured with, for drawing it.
     """
     font_size = get_adjusted_font_size(config)
 
@@ -403,22 +484,87 @@ def calculate_minimal_image_dimensions(text, config):
         width = padded_width  # Text width + left and right padding
         height = tape_width_pixels  # Full tape width becomes image height
 
-    return width, height, text_width, text_height, bbox
+    return width, height, text_width, text_height, bbox, font
 
 
-def load_font_for_measurement(font_path, font_size):
-    """Load font for text measurement, with fallbacks"""
-    from PIL import ImageFont  # type: ignore[import-not-found]
+def resolve_font_path(font):
+    """Find the font file to render with
+
+    A font that is not an existing file, a stale path or a family name
+    such as "DejaVu Sans", is looked up with fc-match instead of falling
+    back to PIL's tiny built-in font on every label. The match is kept in
+    FONT_CACHE_FILE, so fc-match only runs again once that file is gone.
+    """
+    if not font or os.path.isfile(font):
+        return font
 
     try:
-        if font_path and os.path.exists(font_path):
-            return ImageFont.truetype(font_path, font_size)
-    except Exception:
+        with open(FONT_CACHE_FILE) as f:
+            fonts = json.load(f)
+    except (OSError, ValueError):
+        fonts = {}
+    if not isinstance(fonts, dict):
+        fonts = {}
+
+    match = fonts.get(font)
+    if isinstance(match, str) and os.path.isfile(match):
+        return match
+
+    import subprocess
+
+    name = Path(font).stem if os.sep in font else font
+    try:
+        result = subprocess.run(
+            ["fc-match", "--format=%{file}", name],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return font
+
+    match = result.stdout.strip()
+    if result.returncode != 0 or not os.path.isfile(match):
+        return font
+
+    # Caching is best effort, the match is still used for this run
+    fonts[font] = match
+    try:
+        FONT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = FONT_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(fonts, f, indent=2)
+        os.replace(tmp_path, FONT_CACHE_FILE)
+    except OSError:
         pass
+    return match
+
+
+@functools.lru_cache(maxsize=16)
+def _font_mtime_ns(font_path):
+    """Stat the font file once per run, None if it is missing"""
+    try:
+        return os.stat(font_path).st_mtime_ns if font_path else None
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _load_truetype(font_path, font_size, mtime_ns):
+    """Parse a TrueType font, cached until the font file changes"""
+    from PIL import ImageFont  # type: ignore[import-not-found]
+
+    return ImageFont.truetype(font_path, font_size)
+
+
+def load_font_for_measurement(font_path, font_size):
+    """Load font for text measurement, with fallbacks"""
+    from PIL import ImageFont  # type: ignore[import-not-found]
 
     try:
-        if font_path and os.path.exists(font_path):
-            return ImageFont.truetype(font_path, font_size)
+        mtime_ns = _font_mtime_ns(font_path)
+        if mtime_ns is not None:
+            return _load_truetype(font_path, font_size, mtime_ns)
     except Exception:
         pass
 
@@ -428,12 +574,61 @@ def load_font_for_measurement(font_path, font_size):
         raise RuntimeError("PIL/Pillow not available for font loading")
 
 
+def get_render_cache_path(text, config):
+    """Get the cache path for an image of text rendered with config"""
+    import hashlib
+
+    font = config.get("font")
+    font_mtime_ns = _font_mtime_ns(font)
+
+    key = json.dumps(
+        {
+            "version": RENDER_CACHE_VERSION,
+            "text": text,
+            "font": font,
+            "font_mtime_ns": font_mtime_ns,
+            "font_size": get_adjusted_font_size(config),
+            "label_width_mm": config["label_width_mm"],
+            "pixels_per_mm": config["pixels_per_mm"],
+            "rotate": config["rotate"],
+        },
+        sort_keys=True,
+    )
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return RENDER_CACHE_DIR / f"{digest}.jpg"
+
+
+def store_in_render_cache(image_path, cache_path):
+    """Keep a copy of a rendered image, caching is best effort"""
+    import shutil
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(image_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def create_text_image(text, config, debug=False):
     """Create JPEG image from text using PIL"""
+    import shutil
+
+    # Each label still gets its own file, since printed (or queued) label
+    # files are deleted once the queue worker is done with them
+    cache_path = get_render_cache_path(text, config)
+    tmp_path = create_image_file(text)
+    try:
+        shutil.copyfile(cache_path, tmp_path)
+        print(f"♻️  Reusing previously rendered image: {tmp_path}")
+        return tmp_path
+    except FileNotFoundError:
+        pass
+
     print("📏 Calculating minimal image dimensions...")
-    width, height, text_width, text_height, bbox = calculate_minimal_image_dimensions(
-        text, config
-    )
+    dimensions = calculate_minimal_image_dimensions(text, config)
+    width, height, text_width, text_height, bbox, _ = dimensions
     font_size = get_adjusted_font_size(config)
 
     print(
@@ -441,12 +636,11 @@ def create_text_image(text, config, debug=False):
     )
     print(f"   Using font size: {font_size} (thermal optimized)")
 
-    tmp_path = create_image_file(text)
-
     # Create image with PIL
     print("🎨 Creating image with PIL...")
-    if try_pil_image_creation(text, config, tmp_path, debug):
+    if try_pil_image_creation(text, config, tmp_path, dimensions, debug):
         print(f"✅ Image created successfully with PIL: {tmp_path}")
+        store_in_render_cache(tmp_path, cache_path)
         return tmp_path
 
     # PIL failed
@@ -460,41 +654,10 @@ def create_text_image(text, config, debug=False):
     )
 
 
-PRINT_TIMEOUT = 120  # 2 minutes
-
-
-def build_print_command(image_path, config, force_direct=False):
-    """Build the command to print the label"""
-    # Try to use the installed label-raw command, fallback to python -m
-    import shutil
-
-    labelprinter_cmd = shutil.which("label-raw")
-    if labelprinter_cmd:
-        base_cmd = [labelprinter_cmd]
-    else:
-        # Fallback for development mode
-        base_cmd = ["python", "-m", "labelprinter"]
-
-    cmd = base_cmd + [
-        "--host",
-        config["host"],
-        "--print-jpeg",
-        image_path,
-        "--print-mode",
-        "vivid",
-        "--print-cut",
-        "full",
-    ]
-
-    # If direct mode is forced (cups disabled), pass --direct to label-raw
-    if force_direct or not config.get("cups", {}).get("enabled", False):
-        cmd.append("--direct")
-
-    return cmd
-
-
 def submit_to_cups(image_path, config, debug=False):
     """Submit print job to CUPS queue"""
+    import subprocess
+
     queue_name = config.get("cups", {}).get("queue_name", "BrotherVC500W")
 
     print(f"📬 Submitting job to CUPS queue '{queue_name}'...")
@@ -546,105 +709,88 @@ def submit_to_cups(image_path, config, debug=False):
         return 1
 
 
-def print_label(image_path, config, debug=False, force_direct=False):
-    """Print the label using the main labelprinter module
+def print_labels(image_paths, config, debug=False, address=None):
+    """Print labels with label-raw's printing code, in this process
+
+    All labels are sent over a single printer connection, to address
+    when the printer host was already resolved.
 
     Returns:
         int: 0 for success, 1 for failure
     """
-    print("🔗 Building print command...")
-    cmd = build_print_command(image_path, config, force_direct=force_direct)
+    import contextlib
+    import io
 
-    if debug:
-        print(f"   Command: {' '.join(cmd)}")
+    from labelprinter.__main__ import print_jpeg
+    from labelprinter.connection import Connection
+    from labelprinter.printer import LabelPrinter
 
     print(f"🖨️  Connecting to printer at {config['host']}...")
     print("   (This may take 10-60 seconds depending on network and printer state)")
-    print(
-        "   The printer will show 'Connected to the VC-500W' when connection succeeds"
-    )
 
+    # label-raw's own progress messages are only shown in debug mode
+    output = io.StringIO()
+    connection = None
+    printed = 0
     try:
-        start_time = time.time()
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,  # Always capture for error handling
-            text=False,  # Get bytes so we can decode properly
-            timeout=PRINT_TIMEOUT,
-        )
-        end_time = time.time()
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(output):
+            connection = Connection(address or config["host"], 9100)
+            printer = LabelPrinter(connection)
+            for image_path in image_paths:
+                with open(image_path, "rb") as jpeg_file:
+                    if not print_jpeg(
+                        printer, False, "vivid", "full", jpeg_file, False
+                    ):
+                        break
+                printed += 1
+        end_time = time.perf_counter()
+
+    except ValueError as e:
+        # Connection errors from connection.py already list possible solutions
+        print("\n❌ Connection Error:")
+        print(str(e).strip())
+        return 1
+    except TimeoutError as e:
+        print("\n❌ Printer Timeout:")
+        print(str(e).strip())
+        if "did not become idle" in str(e):
+            print("\nThe printer is busy with another job or needs attention.")
+            print("Please wait for the current job to finish and try again.")
+        return 1
+    except Exception as e:
+        print(f"\n❌ Print failed: {type(e).__name__}: {e}")
+        return 1
+    finally:
+        if connection:
+            connection.close()
+        if debug and output.getvalue():
+            print(f"   Print output:\n{output.getvalue().rstrip()}")
+        if printed and printed < len(image_paths):
+            print(f"   ({printed} of {len(image_paths)} labels were printed)")
 
-        if debug:
-            if result.stdout:
-                print(f"   Print stdout: {result.stdout.decode()}")
-            if result.stderr:
-                print(f"   Print stderr: {result.stderr.decode()}")
+    if printed < len(image_paths):
+        print(f"\n❌ Print failed: {image_paths[printed]} is not a JPEG file")
+        return 1
 
-        duration = end_time - start_time
+    duration = end_time - start_time
+    if len(image_paths) > 1:
+        print(f"✅ Printed {printed} labels in {duration:.1f} seconds")
+    else:
         print(f"✅ Print completed in {duration:.1f} seconds")
-        return 0  # Return success code
-
-    except subprocess.TimeoutExpired:
-        raise RuntimeError(
-            f"Print command timed out after {PRINT_TIMEOUT} seconds. This could mean:\n"
-            "  - Printer is busy/offline\n"
-            "  - Network connection issues\n"
-            "  - Printer needs to be unlocked (use --print-lock if needed)\n"
-            "  - Try again in a few moments"
-        )
-    except subprocess.CalledProcessError as e:
-        stderr_msg = e.stderr.decode() if e.stderr else "No stderr output"
-        stdout_msg = e.stdout.decode() if e.stdout else "No stdout output"
-
-        import re
-
-        # Extract the actual error message if it's a ValueError from connection.py
-        if "ValueError:" in stderr_msg:
-            # Find the ValueError message and extract it
-            # Look for ValueError: followed by the message until double newline or end
-            error_match = re.search(
-                r"ValueError: (.+?)(?:\n\n|\Z)", stderr_msg, re.DOTALL
-            )
-            if error_match:
-                error_text = error_match.group(1).strip()
-                # Remove the "The above exception..." if present
-                error_text = re.sub(
-                    r"\n*The above exception.*$", "", error_text, flags=re.DOTALL
-                )
-                # Show just the ValueError message which already has helpful solutions
-                print("\n❌ Connection Error:")
-                print(error_text)
-                return 1  # Return error code instead of raising
-
-        # Extract TimeoutError for printer state timeout
-        if "TimeoutError:" in stderr_msg:
-            error_match = re.search(
-                r"TimeoutError: (.+?)(?:\n\n|\Z)", stderr_msg, re.DOTALL
-            )
-            if error_match:
-                error_text = error_match.group(1).strip()
-                print("\n❌ Printer Timeout:")
-                print(error_text)
-                if "did not become idle" in error_text:
-                    print("\nThe printer is busy with another job or needs attention.")
-                    print("Please wait for the current job to finish and try again.")
-                return 1
-
-        # For other errors, show full details
-        print(f"\n❌ Print failed with exit code {e.returncode}")
-        if "SyntaxWarning" not in stderr_msg:  # Don't show syntax warnings
-            if stdout_msg and stdout_msg != "No stdout output":
-                print(f"\nOutput:\n{stdout_msg}")
-            if stderr_msg and stderr_msg != "No stderr output":
-                print(f"\nError details:\n{stderr_msg}")
-        return 1  # Return error code instead of raising
+    return 0
 
 
 def setup_argument_parser():
     """Create and configure the argument parser"""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Print text labels on Brother VC-500W")
-    parser.add_argument("text", help="Text to print on the label")
+    parser.add_argument(
+        "text",
+        nargs="+",
+        help="Text to print on the label (several texts print one label each, - reads one text per line from stdin)",
+    )
     parser.add_argument("--host", help="Printer IP address (overrides config)")
     parser.add_argument(
         "--width", type=int, help="Label width in mm (overrides config)"
@@ -721,10 +867,28 @@ def apply_config_overrides(config, args):
     return overrides
 
 
+def read_texts(texts):
+    """Expand a "-" argument into the non-blank lines of stdin"""
+    result = []
+    for text in texts:
+        if text == "-":
+            # Keep each label's own spacing, only drop the line ending
+            lines = (line.rstrip("\n") for line in sys.stdin)
+            result.extend(line for line in lines if line.strip())
+        else:
+            result.append(text)
+    return result
+
+
+def format_texts(texts):
+    """Format the label texts for display"""
+    return ", ".join(f"'{text}'" for text in texts)
+
+
 def print_configuration(args, config, overrides):
     """Print the final configuration"""
     print("\n📋 Final configuration:")
-    print(f"   Text: '{args.text}'")
+    print(f"   Text: {format_texts(args.text)}")
     print(f"   Label width: {config['label_width_mm']}mm")
     print(f"   Font: {config['font']} (size {config['font_size']})")
     print(f"   Rotation: {config['rotate']}°")
@@ -753,22 +917,25 @@ def handle_dry_run(image_path, config, args):
 
 def preview_image(image_path):
     """Try to preview the image using terminal viewers"""
+    import shutil
+    import subprocess
+
     print("   🖼️  Trying to preview image...")
-    viewers = [
-        ["chafa", image_path],
-        ["catimg", image_path],
-        ["tiv", image_path],
-    ]
 
-    for viewer_cmd in viewers:
+    # Look viewers up on PATH rather than trying to run each in turn
+    for viewer in ("chafa", "catimg", "tiv"):
+        viewer_path = shutil.which(viewer)
+        if not viewer_path:
+            continue
+
         try:
-            print(f"   Trying {viewer_cmd[0]}...")
-            subprocess.run(viewer_cmd, check=True, timeout=10)
+            print(f"   Trying {viewer}...")
+            subprocess.run([viewer_path, image_path], check=True, timeout=10)
             break
         except (
             subprocess.CalledProcessError,
-            FileNotFoundError,
             subprocess.TimeoutExpired,
+            OSError,
         ):
             continue
     else:
@@ -777,39 +944,40 @@ def preview_image(image_path):
         )
 
 
-def handle_printing(image_path, config, args):
+def handle_printing(image_paths, config, args, address=None):
     """Handle the printing phase"""
     # Check if CUPS mode is enabled
     cups_enabled = config.get("cups", {}).get("enabled", False)
 
     if cups_enabled:
         print("\n📬 Phase 2: Submitting to CUPS queue...")
-        result = submit_to_cups(image_path, config, debug=args.debug)
-        if result == 1:
-            return 1
-        print(f"\n   Image saved: {image_path}")
+        for image_path in image_paths:
+            result = submit_to_cups(image_path, config, debug=args.debug)
+            if result == 1:
+                return 1
+            print(f"\n   Image saved: {image_path}")
         return 0
     else:
         print("\n🖨️  Phase 2: Printing label...")
-        # Pass cups_enabled=False as force_direct=True to ensure label-raw also uses direct mode
-        force_direct = not cups_enabled
-        result = print_label(
-            image_path, config, debug=args.debug, force_direct=force_direct
-        )
+        result = print_labels(image_paths, config, debug=args.debug, address=address)
         if result == 1:
-            # Error already printed by print_label
+            # Error already printed by print_labels
             return 1
         print("\n✅ Print complete!")
-        print(f"   Image saved: {image_path}")
+        for image_path in image_paths:
+            print(f"   Image saved: {image_path}")
         return 0
 
 
 def main():
     parser = setup_argument_parser()
     args = parser.parse_args()
+    args.text = read_texts(args.text)
+    if not args.text:
+        parser.error("no label text given on stdin")
 
     print("🚀 Starting label printer...")
-    print(f"   Text: '{args.text}'")
+    print(f"   Text: {format_texts(args.text)}")
 
     # Load configuration
     print("⚙️  Loading configuration...")
@@ -818,6 +986,12 @@ def main():
     print(f"   Default host: {config['host']}")
     print(f"   Default tape width: {config.get('default_tape_width_mm', 25)}mm")
 
+    # Resolve the font once for every label of this run
+    font = resolve_font_path(config.get("font"))
+    if font != config.get("font"):
+        print(f"   Using font {font} in place of missing {config['font']}")
+        config["font"] = font
+
     # Apply overrides
     overrides = apply_config_overrides(config, args)
 
@@ -868,16 +1042,28 @@ def main():
     # Print final configuration
     print_configuration(args, config, overrides)
 
+    # Without tape detection nothing has contacted the printer yet
+    direct_print = not args.dry_run and not config.get("cups", {}).get("enabled")
+    lookup = None
+    if direct_print and (args.width or args.no_auto_detect):
+        lookup = prefetch_host_lookup(config["host"])
+
     try:
         print("\n🖼️  Phase 1: Creating image...")
-        image_path = create_text_image(args.text, config, debug=args.debug)
+        # Render every label first so they can all go out over one connection
+        image_paths = [
+            create_text_image(text, config, debug=args.debug) for text in args.text
+        ]
 
         if args.dry_run:
-            handle_dry_run(image_path, config, args)
+            for image_path in image_paths:
+                handle_dry_run(image_path, config, args)
             print("\n🎉 Success! Label processing complete.")
             return 0
         else:
-            result = handle_printing(image_path, config, args)
+            # The lookup had the whole render to finish
+            address = lookup.result() if lookup else None
+            result = handle_printing(image_paths, config, args, address=address)
             # Don't delete the image file when printing - keep it for reference
             if result == 0:
                 print("\n🎉 Success! Label processing complete.")
@@ -894,4 +1080,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
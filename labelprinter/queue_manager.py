@@ -8,19 +8,7 @@ Provides commands to list, cancel, and retry print jobs.
 import argparse
 import sys
 
-# Try to import pycups, show helpful error if not installed
-try:
-    import cups  # type: ignore[import-not-found]
-except ImportError:
-    print("ERROR: pycups is not installed", file=sys.stderr)
-    print("\nCUPS queue mode requires the pycups library.", file=sys.stderr)
-    print("Install it with:", file=sys.stderr)
-    print("  uv tool install --with pycups labelprinter", file=sys.stderr)
-    print("  # or", file=sys.stderr)
-    print("  pip install pycups", file=sys.stderr)
-    sys.exit(1)
-
-from labelprinter.print_text import load_config
+from labelprinter.cups_support import import_cups
 
 
 class QueueManager:
@@ -28,8 +16,9 @@ class QueueManager:
 
     def __init__(self, queue_name):
         self.queue_name = queue_name
+        self.cups = import_cups()
         try:
-            self.conn = cups.Connection()
+            self.conn = self.cups.Connection()
         except RuntimeError as e:
             print(f"ERROR: Cannot connect to CUPS: {e}", file=sys.stderr)
             sys.exit(1)
@@ -116,7 +105,7 @@ class QueueManager:
                     print(f" {state}={count}", end="")
                 print()
 
-        except cups.IPPError as e:
+        except self.cups.IPPError as e:
             print(f"ERROR: Cannot list jobs: {e}", file=sys.stderr)
             sys.exit(1)
 
@@ -126,7 +115,7 @@ class QueueManager:
             self.conn.cancelJob(job_id, purge_job=purge)
             action = "Purged" if purge else "Canceled"
             print(f"✓ {action} job {job_id}")
-        except cups.IPPError as e:
+        except self.cups.IPPError as e:
             print(f"ERROR: Cannot cancel job {job_id}: {e}", file=sys.stderr)
             sys.exit(1)
 
@@ -148,13 +137,13 @@ class QueueManager:
             for job_id in queue_jobs:
                 try:
                     self.conn.cancelJob(job_id, purge_job=purge)
-                except cups.IPPError:
+                except self.cups.IPPError:
                     pass  # Continue with other jobs
 
             action = "Purged" if purge else "Canceled"
             print(f"✓ {action} {len(queue_jobs)} job(s)")
 
-        except cups.IPPError as e:
+        except self.cups.IPPError as e:
             print(f"ERROR: Cannot cancel jobs: {e}", file=sys.stderr)
             sys.exit(1)
 
@@ -163,7 +152,7 @@ class QueueManager:
         try:
             self.conn.setJobHoldUntil(job_id, "indefinite")
             print(f"✓ Job {job_id} held")
-        except cups.IPPError as e:
+        except self.cups.IPPError as e:
             print(f"ERROR: Cannot hold job {job_id}: {e}", file=sys.stderr)
             sys.exit(1)
 
@@ -172,7 +161,7 @@ class QueueManager:
         try:
             self.conn.releaseJob(job_id)
             print(f"✓ Job {job_id} released")
-        except cups.IPPError as e:
+        except self.cups.IPPError as e:
             print(f"ERROR: Cannot release job {job_id}: {e}", file=sys.stderr)
             sys.exit(1)
 
@@ -195,7 +184,7 @@ class QueueManager:
             accepting = printer.get("printer-is-accepting-jobs", False)
             print(f"  Accepting jobs: {'Yes' if accepting else 'No'}")
 
-        except cups.IPPError as e:
+        except self.cups.IPPError as e:
             print(f"ERROR: Cannot get queue status: {e}", file=sys.stderr)
             sys.exit(1)
 
@@ -269,6 +258,9 @@ Examples:
         parser.print_help()
         sys.exit(1)
 
+    # Deferred until after argument parsing so `--help` stays cheap
+    from labelprinter.print_text import load_config
+
     # Get queue name from config
     config = load_config()
 
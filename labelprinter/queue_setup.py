@@ -7,12 +7,11 @@ The queue accepts jobs but holds them for manual processing by label-queue-worke
 """
 
 import argparse
-import json
 import subprocess
 import sys
 
 # Import configuration utilities
-from labelprinter.print_text import load_config, CONFIG_FILE
+from labelprinter.print_text import load_config, save_config, CONFIG_FILE
 
 
 QUEUE_NAME = "BrotherVC500W"
@@ -20,10 +19,31 @@ QUEUE_DESCRIPTION = "Brother VC-500W Label Printer (Queue Mode)"
 QUEUE_LOCATION = "Network Label Printer"
 
 
+def import_cups():
+    """
+    Import pycups on first use, None if it is not installed
+
+    pycups is optional here: without it, fall back to the CUPS
+    command-line tools. Deferred so that `--help` and `--check`
+    don't pay for loading it.
+    """
+    try:
+        import cups  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+
+    return cups
+
+
 def check_cups_installed():
     """Check if CUPS commands are available"""
     try:
-        subprocess.run(["lpstat", "-v"], capture_output=True, check=True)
+        subprocess.run(
+            ["lpstat", "-v"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
@@ -33,7 +53,9 @@ def check_queue_exists(queue_name):
     """Check if a CUPS queue already exists"""
     try:
         result = subprocess.run(
-            ["lpstat", "-p", queue_name], capture_output=True, text=True
+            ["lpstat", "-p", queue_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         return result.returncode == 0
     except FileNotFoundError:
@@ -47,7 +69,30 @@ def create_cups_queue(queue_name, description, location):
     Uses file:///dev/null backend which causes CUPS to respool jobs.
     The worker deletes image files after printing, so respooled jobs
     fail and are auto-canceled on next worker run.
+
+    Talks IPP to cupsd directly when pycups is available, otherwise
+    runs lpadmin, cupsaccept and cupsdisable.
     """
+    cups = import_cups()
+    if cups is not None:
+        try:
+            conn = cups.Connection()
+            # Null device - jobs complete immediately without output
+            conn.addPrinter(
+                queue_name,
+                device="file:///dev/null",
+                info=description,
+                location=location,
+            )
+            conn.setPrinterShared(queue_name, False)  # Don't share over network
+            # Accept jobs but keep printer stopped so they won't print automatically
+            conn.acceptJobs(queue_name)
+            conn.disablePrinter(queue_name)
+            return True
+        except (cups.IPPError, RuntimeError) as e:
+            print(f"Error creating CUPS queue: {e}", file=sys.stderr)
+            return False
+
     try:
         # Create a queue without enabling it (-E)
         # This allows jobs to queue but prevents automatic processing
@@ -96,15 +141,22 @@ def update_config_for_cups(queue_name):
     config["cups"]["auto_process"] = False  # Manual processing by worker
 
     # Save updated config
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    save_config(config)
 
     return True
 
 
 def remove_cups_queue(queue_name):
     """Remove the CUPS queue"""
+    cups = import_cups()
+    if cups is not None:
+        try:
+            cups.Connection().deletePrinter(queue_name)
+            return True
+        except (cups.IPPError, RuntimeError) as e:
+            print(f"Error removing CUPS queue: {e}", file=sys.stderr)
+            return False
+
     try:
         subprocess.run(
             ["lpadmin", "-x", queue_name], check=True, capture_output=True, text=True
@@ -122,8 +174,7 @@ def disable_cups_in_config():
     if "cups" in config:
         config["cups"]["enabled"] = False
 
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    save_config(config)
 
     return True
 
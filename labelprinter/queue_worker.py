@@ -7,35 +7,177 @@ It handles printer busy states with retries and provides clear status updates.
 """
 
 import argparse
+import contextlib
+import functools
+import io
+import os
+import re
+import selectors
+import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Try to import pycups, show helpful error if not installed
-try:
-    import cups  # type: ignore[import-not-found]
-except ImportError:
-    print("ERROR: pycups is not installed", file=sys.stderr)
-    print("\nCUPS queue mode requires the pycups library.", file=sys.stderr)
-    print("Install it with:", file=sys.stderr)
-    print("  uv tool install --with pycups labelprinter", file=sys.stderr)
-    print("  # or", file=sys.stderr)
-    print("  pip install pycups", file=sys.stderr)
-    sys.exit(1)
+from labelprinter.cups_support import import_cups
 
-from labelprinter.print_text import load_config
+# Where label-text saves images; CUPS only gives us their basename
+LABELS_DIR = Path.home() / ".local" / "share" / "labelprinter" / "images"
+
+# Number of upcoming jobs prepared in the background while one prints
+PREFETCH_JOBS = 2
+
+# Job attributes needed to select and print held jobs
+JOB_ATTRIBUTES = [
+    "job-id",
+    "job-name",
+    "job-state",
+    "job-printer-uri",
+    "document-name-supplied",
+]
+
+# Additional job attributes only requested for verbose logging
+VERBOSE_JOB_ATTRIBUTES = ["job-state-reasons", "job-originating-user-name"]
+
+# Banner line around per-job output and the final summary
+SEPARATOR = "=" * 60
+
+# How much of label-raw's stdout/stderr is kept for error reporting
+OUTPUT_TAIL_BYTES = 16 * 1024
+
+# Busy retries per job before it is given up on and marked failed
+MAX_BUSY_RETRIES = 8
+
+# Printer output meaning the job should be retried later rather than failed
+BUSY_PATTERN = re.compile(r"busy|did not become idle", re.IGNORECASE)
+
+# Clock for busy retry and wait deadlines, swapped out by the tests
+clock = time.monotonic
+
+
+def run_with_output_tail(cmd, timeout):
+    """
+    Run a command, keeping only the last OUTPUT_TAIL_BYTES of its output
+
+    Returns:
+        (returncode, stdout, stderr) - with the output tails decoded
+
+    Raises:
+        subprocess.TimeoutExpired: if the command ran longer than timeout
+    """
+    # An absolute executable path and close_fds=False let CPython
+    # spawn the child via posix_spawn instead of fork+exec, avoiding
+    # a copy-on-write duplicate of the worker's heap per job.
+    # Our own descriptors are non-inheritable (PEP 446), so nothing
+    # leaks into the child.
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False
+    )
+    tails = {process.stdout: bytearray(), process.stderr: bytearray()}
+    deadline = time.monotonic() + timeout
+
+    # Drain both pipes as output arrives so a chatty child can't block
+    # on a full pipe, but never hold more than the tail in memory
+    with process, selectors.DefaultSelector() as selector:
+        for pipe in tails:
+            selector.register(pipe, selectors.EVENT_READ)
+
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                process.kill()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+            for key, _ in selector.select(remaining):
+                chunk = key.fileobj.read1(65536)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    continue
+
+                tail = tails[key.fileobj]
+                tail += chunk
+                del tail[:-OUTPUT_TAIL_BYTES]
+
+        # The child may close its output and keep running
+        try:
+            returncode = process.wait(max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise
+
+    return (
+        returncode,
+        tails[process.stdout].decode(errors="replace"),
+        tails[process.stderr].decode(errors="replace"),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def resolve_job_file(doc_name):
+    """
+    Resolve a job's document name to an existing image file, or None
+
+    Cached so busy jobs that are retried don't hit the filesystem again.
+    process_queue clears the cache whenever the queue drains.
+    """
+    # Use the full path if one was provided, otherwise look in the dedicated
+    # labels directory (joining an absolute path would just stat it again)
+    image_file = Path(doc_name)
+    if not image_file.is_absolute():
+        image_file = LABELS_DIR / doc_name
+
+    return image_file if image_file.exists() else None
 
 
 class QueueWorker:
     """Processes print jobs from CUPS queue"""
 
-    def __init__(self, queue_name, dry_run=False, verbose=False):
+    def __init__(
+        self,
+        queue_name,
+        dry_run=False,
+        verbose=False,
+        config=None,
+        use_subprocess=False,
+    ):
+        from labelprinter.print_text import load_config
+
         self.queue_name = queue_name
         self.dry_run = dry_run
         self.verbose = verbose
-        self.conn = cups.Connection()
-        self.config = load_config()
+        self._printer_uri_suffix = f"/printers/{queue_name}"
+        self.cups = import_cups()
+        self.conn = self.cups.Connection()
+        self.config = config if config is not None else load_config()
+        self.use_subprocess = use_subprocess
+
+        # Printer connection kept open across back-to-back jobs
+        self._printer_conn = None
+        self._printer = None
+
+        # CUPS job event subscription used to wait for new jobs in daemon
+        # mode; None until created, False if cupsd refused it
+        self._subscription_id = None
+        self._notify_seq = 1
+
+        # Last get_held_jobs result, valid until the subscription reports
+        # a job event we didn't cause ourselves
+        self._held_jobs = None
+        self._own_job_ids = set()
+
+        # The label-raw invocation only varies by job file, so resolve the
+        # executable and host once. An absolute path is also what lets
+        # subprocess use posix_spawn (see _print_with_label_raw).
+        self._cmd_prefix = None
+        if use_subprocess:
+            self._cmd_prefix = (
+                shutil.which("label-raw") or "label-raw",
+                "--host",
+                self.config["host"],
+                "--direct",  # Force direct printing (avoid re-queuing to CUPS)
+                "--print-jpeg",
+            )
 
     def log(self, message, force=False):
         """Print log message if verbose or forced"""
@@ -119,96 +261,275 @@ class QueueWorker:
 
     def get_held_jobs(self):
         """Get all held/pending jobs from the queue"""
+        # Busy retries would otherwise re-list an unchanged queue
+        if self._held_jobs is not None and not self._poll_job_events():
+            self.log("No job changes reported by CUPS, reusing job list")
+            return self._held_jobs
+
         try:
+            # Only ask CUPS for what the filter and print_job use;
+            # the extra attributes are just for verbose logging
+            requested_attributes = JOB_ATTRIBUTES
+            if self.verbose:
+                requested_attributes = JOB_ATTRIBUTES + VERBOSE_JOB_ATTRIBUTES
+
             jobs = self.conn.getJobs(
                 which_jobs="not-completed",
                 my_jobs=False,
-                requested_attributes=[
-                    "job-id",
-                    "job-name",
-                    "job-state",
-                    "job-state-reasons",
-                    "job-originating-user-name",
-                    "job-printer-uri",
-                    "document-name-supplied",
-                ],
+                requested_attributes=requested_attributes,
             )
 
-            self.log(f"Found {len(jobs)} total not-completed jobs")
+            # Per-job messages are only formatted in verbose mode, since
+            # this runs on every poll in daemon mode
+            verbose = self.verbose
+            if verbose:
+                self.log(f"Found {len(jobs)} total not-completed jobs")
 
             # Filter to our queue and held jobs
             held_jobs = []
             for job_id, job_info in jobs.items():
+                # pycups can't scope getJobs to one printer, so drop jobs
+                # for other queues before looking at them any further
+                if not job_info.get("job-printer-uri", "").endswith(
+                    self._printer_uri_suffix
+                ):
+                    continue
+
                 state = job_info.get("job-state")
-                doc_name = job_info.get("document-name-supplied", "")
-                self.log(f"  Job {job_id}: state={state}, document={doc_name}")
+                if verbose:
+                    self.log(
+                        f"  Job {job_id}: state={state}, "
+                        f"document={job_info.get('document-name-supplied', '')}, "
+                        f"user={job_info.get('job-originating-user-name', '')}, "
+                        f"reasons={job_info.get('job-state-reasons', '')}"
+                    )
 
                 # CUPS job state: 3 = pending (stopped printer), 4 = pending, 5 = held, 6 = processing
-                if job_info.get("job-state") in [3, 4, 5]:  # pending or held
+                if state in [3, 4, 5]:  # pending or held
                     held_jobs.append((job_id, job_info))
-                    self.log("    -> Added to processing list")
+                    if verbose:
+                        self.log("    -> Added to processing list")
 
-            self.log(f"Total jobs to process: {len(held_jobs)}")
-            return sorted(held_jobs, key=lambda x: x[0])  # Sort by job ID
+            if verbose:
+                self.log(f"Total jobs to process: {len(held_jobs)}")
+            # cupsd already returns active jobs in queue order (priority,
+            # then job ID) and dicts keep that order, so no sort is needed
+            self._held_jobs = held_jobs
+            return held_jobs
 
-        except cups.IPPError as e:
+        except self.cups.IPPError as e:
             self.log(f"Error getting jobs from CUPS: {e}", force=True)
+            self._held_jobs = None
             return []
 
-    def get_job_file(self, job_id, job_info):
+    def _subscribe(self):
+        """
+        Subscribe to job events on our queue
+
+        Returns:
+            True if a subscription was created, False if not available
+        """
+        try:
+            self._subscription_id = self.conn.createSubscription(
+                f"ipp://localhost/printers/{self.queue_name}",
+                events=["job-created", "job-state-changed", "job-completed"],
+            )
+            self._notify_seq = 1
+            self._held_jobs = None
+            self.log(f"Subscribed to CUPS job events ({self._subscription_id})")
+            return True
+        except self.cups.IPPError as e:
+            self.log(f"CUPS job events unavailable, polling instead: {e}")
+            self._subscription_id = False
+            return False
+
+    def cancel_subscription(self):
+        """Cancel the CUPS job event subscription, if any"""
+        if self._subscription_id:
+            try:
+                self.conn.cancelSubscription(self._subscription_id)
+            except self.cups.IPPError:
+                pass  # Expires with its lease anyway
+        self._subscription_id = None
+
+    def _poll_job_events(self):
+        """
+        Check the subscription for job events since the last check
+
+        Returns:
+            True if jobs may have changed (new events, or no usable
+            subscription), False if CUPS reported nothing new
+        """
+        if not self._subscription_id:
+            return True
+
+        try:
+            notifications = self.conn.getNotifications(
+                [self._subscription_id], sequence_numbers=[self._notify_seq]
+            )
+        except self.cups.IPPError as e:
+            # Most likely the lease expired; resubscribe on next wait
+            self.log(f"Lost CUPS job event subscription: {e}")
+            self._subscription_id = None
+            self._held_jobs = None
+            return True
+
+        events = notifications.get("events", [])
+        if not events:
+            return False
+
+        self._notify_seq = events[-1]["notify-sequence-number"] + 1
+
+        # Canceling a printed job is already reflected in the cached list
+        if all(event.get("notify-job-id") in self._own_job_ids for event in events):
+            return False
+
+        self._held_jobs = None
+        self._own_job_ids.clear()
+        return True
+
+    def wait_for_job_events(self, poll_interval, timeout=None):
+        """
+        Block until CUPS reports a job event on our queue
+
+        Checking for notifications is much cheaper than listing every
+        not-completed job, so getJobs only runs again once something
+        changed. Falls back to a plain poll_interval sleep when cupsd
+        doesn't allow subscriptions. Gives up after timeout seconds
+        when one is given.
+        """
+        deadline = None if timeout is None else clock() + timeout
+
+        if self._subscription_id is None:
+            # A job may have arrived before the subscription existed,
+            # so look at the queue once more right away
+            if self._subscribe():
+                return
+
+        while True:
+            interval = poll_interval
+            if deadline is not None:
+                interval = min(interval, deadline - clock())
+                if interval <= 0:
+                    return
+
+            if self._subscription_id and self._poll_job_events():
+                return
+
+            time.sleep(interval)
+
+            if not self._subscription_id:
+                return
+
+    def get_job_file(self, job_id, job_info, log=None):
         """
         Get the file path for a CUPS job
 
         Since we can't access /var/spool/cups without root,
         we use the document-name-supplied attribute which contains
         the original filename (basename only).
+
+        Messages go to log, which defaults to self.log.
         """
+        log = log or self.log
         try:
             # document-name-supplied contains just the filename
             doc_name = job_info.get("document-name-supplied", "")
 
             if doc_name:
-                # Try as absolute path first (if full path was provided)
-                image_file = Path(doc_name)
-                if image_file.is_absolute() and image_file.exists():
-                    self.log(f"Found image file: {image_file}")
+                image_file = resolve_job_file(doc_name)
+                if image_file is not None:
+                    if self.verbose:
+                        log(f"Found image file: {image_file}")
                     return image_file
 
-                # Look in the dedicated labels directory
-                labels_dir = (
-                    Path.home() / ".local" / "share" / "labelprinter" / "images"
-                )
-                image_file = labels_dir / doc_name
-                if image_file.exists():
-                    self.log(f"Found image file: {image_file}")
-                    return image_file
-
-                self.log(f"Image file not found: {doc_name} (tried {labels_dir})")
+                if self.verbose:
+                    log(f"Image file not found: {doc_name} (tried {LABELS_DIR})")
             else:
-                self.log("No document name in job info")
+                log("No document name in job info")
 
             return None
 
         except Exception as e:
-            self.log(f"Error finding job file: {e}", force=True)
+            log(f"Error finding job file: {e}", force=True)
             return None
 
-    def print_job(self, job_id, job_info):
+    def prepare_job(self, job_id, job_info):
+        """
+        Resolve and read a job's image file ahead of printing
+
+        process_queue runs this in the background for the next jobs while
+        the current one prints, so the image is already in the page cache
+        when it's sent and unreadable files fail without a printer round
+        trip.
+
+        Returns:
+            (job_file, error_message, messages) - job_file is None if not
+            found; messages are (message, force) log calls for the caller
+            to make in order, since this runs on a pool thread while
+            another job prints
+        """
+        messages = []
+
+        def log(message, force=False):
+            messages.append((message, force))
+
+        job_file = self.get_job_file(job_id, job_info, log=log)
+        if job_file is None:
+            return (None, None, messages)
+
+        try:
+            with open(job_file, "rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                if not size:
+                    return (job_file, "Image file is empty", messages)
+
+                # The image goes to the printer with sendfile(), so only
+                # ask the kernel to read it ahead rather than copying it
+                # through Python
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(handle.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+                else:
+                    handle.read()
+        except FileNotFoundError:
+            return (None, None, messages)
+        except OSError as e:
+            return (job_file, f"Cannot read image file: {e}", messages)
+
+        return (job_file, None, messages)
+
+    def print_job(self, job_id, job_info, prepared=None):
         """
         Print a job using the existing label-raw infrastructure
 
+        Runs label-raw's print code in-process, or label-raw itself when
+        use_subprocess is set.
+
+        Args:
+            job_id: CUPS job ID
+            job_info: Job attributes from get_held_jobs
+            prepared: Optional future for prepare_job's result, as
+                started by process_queue
+
         Returns:
             (success, error_message, should_retry)
         """
         job_name = job_info.get("job-name", f"Job {job_id}")
 
-        self.log(f"\n{'=' * 60}", force=True)
-        self.log(f"Processing job {job_id}: {job_name}", force=True)
-        self.log(f"{'=' * 60}", force=True)
+        self.log(
+            f"\n{SEPARATOR}\nProcessing job {job_id}: {job_name}\n{SEPARATOR}",
+            force=True,
+        )
 
-        # Get the job file
-        job_file = self.get_job_file(job_id, job_info)
-        if not job_file or not job_file.exists():
+        # Get the job file; prepare_job already opened it, so it is None
+        # if the file is gone
+        if prepared is None:
+            job_file, error, messages = self.prepare_job(job_id, job_info)
+        else:
+            job_file, error, messages = prepared.result()
+        for message, force in messages:
+            self.log(message, force=force)
+        if not job_file:
             error = "Job file not found (likely cleaned up or old job)"
             self.log(f"✗ {error}", force=True)
             self.log(f"  Auto-canceling stale job {job_id}", force=True)
@@ -221,38 +542,24 @@ class QueueWorker:
             # Return success=True to avoid "failed" tracking, but with special marker
             return (True, None, False)  # Treated as handled
 
-        self.log(f"Job file: {job_file}")
+        if self.verbose:
+            self.log(f"Job file: {job_file}")
+
+        if error:
+            self.log(f"✗ Job {job_id} failed: {error}", force=True)
+            return (False, error, False)
 
         if self.dry_run:
             self.log(f"[DRY RUN] Would print: {job_file}", force=True)
             return (True, None, False)
 
-        # Build label-raw command
-        cmd = [
-            "label-raw",
-            "--host",
-            self.config["host"],
-            "--print-jpeg",
-            str(job_file),
-            "--direct",  # Force direct printing (avoid re-queuing to CUPS)
-        ]
-
-        # Note: label-raw doesn't have --debug flag
-        # Verbose output is handled by capturing stderr
-
-        # Execute label-raw
         try:
-            if self.verbose:
-                self.log(f"Executing: {' '.join(cmd)}")
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120,  # Same timeout as direct printing
-            )
+            if self.use_subprocess:
+                printed, error_output = self._print_with_label_raw(job_file)
+            else:
+                printed, error_output = self._print_in_process(job_file)
 
-            if result.returncode == 0:
+            if printed:
                 self.log(f"✓ Job {job_id} printed successfully", force=True)
                 # Delete the image file to prevent CUPS respooling from processing it again
                 try:
@@ -266,13 +573,8 @@ class QueueWorker:
                     )
                 return (True, None, False)
             else:
-                error_output = result.stderr.strip() or result.stdout.strip()
-
                 # Check if error is due to printer being busy
-                if (
-                    "BUSY" in error_output.upper()
-                    or "did not become idle" in error_output
-                ):
+                if BUSY_PATTERN.search(error_output):
                     self.log(
                         f"⏸  Printer is busy, job {job_id} will be retried", force=True
                     )
@@ -301,15 +603,126 @@ class QueueWorker:
             self.log(f"✗ Job {job_id} error: {error}", force=True)
             return (False, error, False)  # Don't retry unexpected errors
 
+    def _get_printer(self):
+        """Return a LabelPrinter on the open connection, reconnecting if needed"""
+        from labelprinter.connection import Connection
+        from labelprinter.printer import LabelPrinter
+
+        if self._printer_conn is not None and not self._printer_conn.is_alive():
+            self.log("Printer connection was closed, reconnecting")
+            self.close_printer()
+
+        if self._printer_conn is None:
+            self._printer_conn = Connection(self.config["host"], 9100)
+            self._printer = LabelPrinter(self._printer_conn)
+
+        return self._printer
+
+    def close_printer(self):
+        """Close the printer connection, if open"""
+        if self._printer_conn is not None:
+            self._printer_conn.close()
+        self._printer_conn = None
+        self._printer = None
+
+    def _print_in_process(self, job_file):
+        """
+        Print a job file with label-raw's code, without spawning it
+
+        Returns:
+            (printed, error_output) - errors are formatted as
+            "ExceptionType: message" like label-raw's traceback tail
+        """
+        from labelprinter.__main__ import print_jpeg
+
+        # Capture label-raw's progress messages like the subprocess did
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                printer = self._connect_printer()
+                with open(job_file, "rb") as jpeg_file:
+                    printed = print_jpeg(
+                        printer, False, "vivid", "full", jpeg_file, False
+                    )
+        except Exception as e:
+            # Don't reuse a connection left in an unknown state
+            self.close_printer()
+            return (False, f"{type(e).__name__}: {e}")
+        finally:
+            if self.verbose and output.getvalue():
+                self.log(output.getvalue().rstrip())
+
+        if not printed:
+            return (False, "Error: Not a JPEG file")
+
+        return (True, "")
+
+    def _connect_printer(self):
+        """
+        Return a LabelPrinter whose connection answers requests
+
+        The printer may drop an idle connection between our liveness
+        check and the first request. A reused connection is therefore
+        asked for its status first, and only that request is retried on
+        a fresh connection: nothing has been sent to print yet, so the
+        retry can never print a label twice.
+        """
+        reused = self._printer_conn is not None
+        printer = self._get_printer()
+        if not reused:
+            return printer
+
+        try:
+            printer.get_status()
+        except (ConnectionResetError, BrokenPipeError):
+            self.log("Printer connection was reset, reconnecting")
+            self.close_printer()
+            printer = self._get_printer()
+
+        return printer
+
+    def _print_with_label_raw(self, job_file):
+        """
+        Print a job file by running label-raw in a subprocess
+
+        Returns:
+            (printed, error_output) - stderr, or stdout if stderr is empty
+        """
+        # Build label-raw command
+        cmd = (*self._cmd_prefix, str(job_file))
+
+        # Note: label-raw doesn't have --debug flag
+        # Verbose output is handled by capturing stderr
+
+        if self.verbose:
+            self.log(f"Executing: {' '.join(cmd)}")
+
+        returncode, stdout, stderr = run_with_output_tail(
+            cmd,
+            timeout=120,  # Same timeout as direct printing
+        )
+
+        return (returncode == 0, stderr.strip() or stdout.strip())
+
     def mark_job_completed(self, job_id):
         """
         Mark a job as completed by canceling it from CUPS queue
         """
         try:
             self.conn.cancelJob(job_id, purge_job=True)
-            self.log(f"  ✓ Job {job_id} removed from CUPS queue", force=False)
+            if self.verbose:
+                self.log(f"  ✓ Job {job_id} removed from CUPS queue")
+
+            # Keep the cached job list in step instead of listing the
+            # queue again, and don't let the events for this cancel
+            # invalidate it
+            if self._held_jobs is not None:
+                self._held_jobs = [job for job in self._held_jobs if job[0] != job_id]
+                self._own_job_ids.add(job_id)
             return True
         except Exception as e:
+            # The job may still be queued, so list the queue again
+            self._held_jobs = None
             self.log(f"  Warning: Could not cancel job from CUPS: {e}", force=True)
             # Still return True since the print succeeded
             return True
@@ -342,12 +755,19 @@ class QueueWorker:
 
         Args:
             once: If True, exit after processing current batch (for cron jobs)
-            retry_delay: Seconds to wait before retrying busy printer
-            poll_interval: Seconds to wait before checking for new jobs
+            retry_delay: Initial seconds to wait before retrying a job that
+                found the printer busy. Doubles with each busy retry of that
+                job, up to max(8 * retry_delay, 300); the job is marked failed
+                after MAX_BUSY_RETRIES retries.
+            poll_interval: Seconds between checks for new jobs (CUPS job
+                events when available, otherwise the full job list)
         """
         processed = 0
         failed = 0
-        busy_jobs = []
+        # Jobs waiting on a busy printer: job_id -> (retries, retry time)
+        busy_jobs = {}
+        announced_retry_at = None
+        backoff_cap = max(retry_delay * 8, 300)
         failed_jobs = []  # Track jobs that failed in this run (don't retry)
 
         if not once:
@@ -362,71 +782,135 @@ class QueueWorker:
                 force=True,
             )
 
-        while True:
-            jobs = self.get_held_jobs()
+        if not once:
+            # Lets idle waits and busy retries skip re-listing the queue
+            self._subscribe()
 
-            # Check if all jobs are already failed in this run
-            new_jobs = [job for job in jobs if job[0] not in failed_jobs]
+        # Printing stays serial (one device), only job preparation runs ahead
+        pool = ThreadPoolExecutor(max_workers=PREFETCH_JOBS)
+        try:
+            while True:
+                jobs = self.get_held_jobs()
 
-            if not new_jobs:
-                if busy_jobs:
-                    # Have busy jobs to retry
-                    self.log(
-                        f"\nWaiting {retry_delay}s before retrying {len(busy_jobs)} busy job(s)...",
-                        force=True,
-                    )
-                    time.sleep(retry_delay)
-                    continue
-                elif once:
-                    # One-shot mode: exit when no more jobs
-                    break
-                else:
-                    # Daemon mode: wait for new jobs
-                    # (all current jobs have already failed or queue is empty)
-                    if failed_jobs:
-                        self.log(
-                            f"All {len(failed_jobs)} job(s) failed. Waiting {poll_interval}s for new jobs...",
-                            force=False,
-                        )
+                # Check if all jobs are already failed in this run
+                new_jobs = [job for job in jobs if job[0] not in failed_jobs]
+
+                if not new_jobs:
+                    # Any busy jobs have left the queue (e.g. canceled)
+                    busy_jobs.clear()
+
+                    if once:
+                        # One-shot mode: exit when no more jobs
+                        break
                     else:
+                        # Daemon mode: wait for new jobs
+                        # (all current jobs have already failed or queue is empty)
+                        resolve_job_file.cache_clear()
+                        # Don't hold the printer while idle, so direct
+                        # printing from elsewhere can connect
+                        self.close_printer()
+                        if failed_jobs:
+                            self.log(
+                                f"All {len(failed_jobs)} job(s) failed. Waiting {poll_interval}s for new jobs...",
+                                force=False,
+                            )
+                        else:
+                            self.log(
+                                f"Queue empty, waiting {poll_interval}s for new jobs...",
+                                force=False,
+                            )
+                        self.wait_for_job_events(poll_interval)
+                        continue
+
+                # Each busy job waits out its own backoff, so a wedged job
+                # doesn't hold back jobs that only just found the printer busy
+                queued_ids = {job_id for job_id, _ in new_jobs}
+                for job_id in list(busy_jobs):
+                    if job_id not in queued_ids:
+                        del busy_jobs[job_id]
+
+                now = clock()
+                due_jobs = [
+                    job
+                    for job in new_jobs
+                    if job[0] not in busy_jobs or busy_jobs[job[0]][1] <= now
+                ]
+
+                if not due_jobs:
+                    retry_at = min(retry_at for _, retry_at in busy_jobs.values())
+                    wait = retry_at - now
+                    # Waits cut short by job events resume silently
+                    if retry_at != announced_retry_at:
+                        announced_retry_at = retry_at
                         self.log(
-                            f"Queue empty, waiting {poll_interval}s for new jobs...",
-                            force=False,
+                            f"\nWaiting {wait:.0f}s before retrying {len(busy_jobs)} busy job(s)...",
+                            force=True,
                         )
-                    time.sleep(poll_interval)
+                    # Free the printer's single client slot for label-text
+                    # while waiting; new jobs don't have to sit out the backoff
+                    self.close_printer()
+                    self.wait_for_job_events(poll_interval, timeout=wait)
                     continue
 
-            self.log(f"\nFound {len(new_jobs)} job(s) to process", force=True)
-
-            for job_id, job_info in jobs:
-                # Skip jobs we've already failed in this run
-                if job_id in failed_jobs:
-                    self.log(f"  Skipping job {job_id} (already failed in this run)")
-                    continue
+                self.log(f"\nFound {len(due_jobs)} job(s) to process", force=True)
 
-                # Process the job (no need to release since printer is disabled, not held)
-                success, error, should_retry = self.print_job(job_id, job_info)
+                if self.verbose:
+                    for job_id, _ in jobs:
+                        if job_id in failed_jobs:
+                            self.log(
+                                f"  Skipping job {job_id} (already failed in this run)"
+                            )
+
+                # Two-stage pipeline: keep the next PREFETCH_JOBS jobs being
+                # prepared in the background while the current one prints
+                prepared = {}
+                for job_id, job_info in due_jobs[:PREFETCH_JOBS]:
+                    prepared[job_id] = pool.submit(self.prepare_job, job_id, job_info)
+
+                for index, (job_id, job_info) in enumerate(due_jobs):
+                    if index + PREFETCH_JOBS < len(due_jobs):
+                        next_id, next_info = due_jobs[index + PREFETCH_JOBS]
+                        prepared[next_id] = pool.submit(
+                            self.prepare_job, next_id, next_info
+                        )
 
-                if success:
-                    self.mark_job_completed(job_id)
-                    processed += 1
-                elif should_retry:
-                    busy_jobs.append(job_id)
-                    self.log(
-                        f"  Job {job_id} will be retried (printer busy)", force=True
+                    # Process the job (no need to release since printer is disabled, not held)
+                    success, error, should_retry = self.print_job(
+                        job_id, job_info, prepared=prepared.pop(job_id)
                     )
-                else:
-                    self.mark_job_failed(job_id, error)
-                    failed_jobs.append(job_id)  # Don't retry this job in this run
-                    failed += 1
 
-            # In one-shot mode, exit after processing once
-            # In daemon mode, keep going
-            if once:
-                break
+                    retries = busy_jobs.get(job_id, (0, 0))[0]
+
+                    if success:
+                        self.mark_job_completed(job_id)
+                        processed += 1
+                        busy_jobs.pop(job_id, None)
+                    elif should_retry and retries < MAX_BUSY_RETRIES:
+                        delay = min(retry_delay * 2**retries, backoff_cap)
+                        busy_jobs[job_id] = (retries + 1, clock() + delay)
+                        self.log(
+                            f"  Job {job_id} will be retried in {delay}s (printer busy)",
+                            force=True,
+                        )
+                    else:
+                        if should_retry:
+                            error = f"Printer still busy after {retries} retries"
+                        self.mark_job_failed(job_id, error)
+                        failed_jobs.append(job_id)  # Don't retry this job in this run
+                        failed += 1
+                        busy_jobs.pop(job_id, None)
+
+                # In one-shot mode, exit after processing once
+                # In daemon mode, keep going
+                if once:
+                    break
+        finally:
+            pool.shutdown(wait=False)
+            self.cancel_subscription()
+            self.close_printer()
 
         # Summary (only shown when exiting, not in watch mode)
-        self.log(f"\n{'=' * 60}", force=True)
+        self.log(f"\n{SEPARATOR}", force=True)
         self.log("Queue processing complete", force=True)
         self.log(f"  Processed: {processed}", force=True)
         self.log(f"  Failed: {failed}", force=True)
@@ -435,12 +919,13 @@ class QueueWorker:
         if failed_jobs:
             self.log(f"  Remaining in queue (failed): {len(failed_jobs)}", force=True)
             self.log("  To cancel failed jobs: label-queue cancel <job-id>", force=True)
-        self.log(f"{'=' * 60}", force=True)
+        self.log(SEPARATOR, force=True)
 
         return processed, failed, len(busy_jobs)
 
 
-def main():
+def setup_argument_parser():
+    """Create and configure the argument parser"""
     parser = argparse.ArgumentParser(
         description="Process print jobs from CUPS queue for Brother VC-500W"
     )
@@ -456,7 +941,7 @@ def main():
         "--retry-delay",
         type=int,
         default=30,
-        help="Seconds to wait before retrying busy jobs (default: 30)",
+        help="Initial seconds to wait before retrying a busy job, doubled on each retry of that job (default: 30)",
     )
     parser.add_argument(
         "--poll-interval",
@@ -472,8 +957,19 @@ def main():
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show detailed output"
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run label-raw in a subprocess for each job instead of printing in-process",
+    )
+    return parser
+
 
-    args = parser.parse_args()
+def main():
+    args = setup_argument_parser().parse_args()
+
+    # Deferred until after argument parsing so `--help` stays cheap
+    from labelprinter.print_text import load_config
 
     # Get config
     config = load_config()
@@ -492,7 +988,13 @@ def main():
         print("[DRY RUN MODE - no actual printing will occur]")
 
     # Create worker and process queue
-    worker = QueueWorker(queue_name, dry_run=args.dry_run, verbose=args.verbose)
+    worker = QueueWorker(
+        queue_name,
+        dry_run=args.dry_run,
+        verbose=args.verbose,
+        config=config,
+        use_subprocess=args.subprocess,
+    )
 
     try:
         processed, failed, busy = worker.process_queue(
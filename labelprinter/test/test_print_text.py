@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Tests for label-text's text input, config loading and on-disk caches
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from labelprinter import print_text
+
+
+class TestLoadConfig(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp = Path(tmp_dir.name)
+
+        patcher = mock.patch.object(
+            print_text, "CONFIG_FILE", self.tmp / "labelprinter" / "config.json"
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        print_text._read_config_file.cache_clear()
+        self.addCleanup(print_text._read_config_file.cache_clear)
+
+        self.config = print_text.get_default_config()
+        self.config["host"] = "printer.example"
+        print_text.save_config(self.config)
+
+    def test_repeat_load_reads_once(self):
+        """Tests that loading an unchanged config again skips the read"""
+
+        with mock.patch.object(print_text.os, "read", wraps=os.read) as read:
+            first = print_text.load_config()
+            second = print_text.load_config()
+
+        self.assertEqual(1, read.call_count)
+        self.assertEqual(self.config, second)
+
+        # Callers modify their config, the cached one stays untouched
+        first["cups"]["enabled"] = True
+        self.assertFalse(print_text.load_config()["cups"]["enabled"])
+
+    def test_saved_config_is_read_again(self):
+        """Tests that a config saved since the last load is not served stale"""
+
+        print_text.load_config()
+        self.config["host"] = "other.example"
+        print_text.save_config(self.config)
+
+        self.assertEqual("other.example", print_text.load_config()["host"])
+
+
+class TestRenderCache(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp = Path(tmp_dir.name)
+
+        # Label files go under $HOME, cached renders under RENDER_CACHE_DIR
+        for patcher in (
+            mock.patch.dict(os.environ, {"HOME": str(self.tmp)}),
+            mock.patch.object(
+                print_text, "RENDER_CACHE_DIR", self.tmp / "cache" / "images"
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # Only stat'ed for the cache key; a missing TrueType font makes
+        # rendering fall back to PIL's built-in one
+        self.font = self.tmp / "font.ttf"
+        self.font.write_bytes(b"not really a font")
+        print_text._font_mtime_ns.cache_clear()
+        self.addCleanup(print_text._font_mtime_ns.cache_clear)
+
+        self.config = {
+            "font": str(self.font),
+            "font_size": 50,
+            "label_width_mm": 12,
+            "pixels_per_mm": 12.48,
+            "rotate": 0,
+        }
+
+    def _create_text_image(self, text):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return print_text.create_text_image(text, self.config)
+
+    def test_key_covers_render_settings(self):
+        """Tests that every render setting changes the cache path"""
+
+        path = print_text.get_render_cache_path("Box 1", self.config)
+        self.assertEqual(path, print_text.get_render_cache_path("Box 1", self.config))
+        self.assertEqual(print_text.RENDER_CACHE_DIR, path.parent)
+
+        self.assertNotEqual(
+            path, print_text.get_render_cache_path("Box 2", self.config)
+        )
+        for key, value in (
+            ("font_size", 51),
+            ("rotate", 90),
+            ("label_width_mm", 25),
+            ("pixels_per_mm", 10),
+            ("font", str(self.tmp / "other.ttf")),
+        ):
+            with self.subTest(key=key):
+                config = dict(self.config, **{key: value})
+                self.assertNotEqual(
+                    path, print_text.get_render_cache_path("Box 1", config)
+                )
+
+    def test_key_covers_font_mtime(self):
+        """Tests that changing the font file invalidates cached images"""
+
+        path = print_text.get_render_cache_path("Box 1", self.config)
+
+        mtime_ns = self.font.stat().st_mtime_ns
+        os.utime(self.font, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        # The mtime is only looked up once per run
+        print_text._font_mtime_ns.cache_clear()
+
+        self.assertNotEqual(
+            path, print_text.get_render_cache_path("Box 1", self.config)
+        )
+
+    def test_hit_copies_without_rendering(self):
+        """Tests that a cached image is copied to a new label file"""
+
+        first = self._create_text_image("Box 1")
+        cache_path = print_text.get_render_cache_path("Box 1", self.config)
+        self.assertTrue(cache_path.exists())
+
+        with mock.patch.object(print_text, "try_pil_image_creation") as render:
+            second = self._create_text_image("Box 1")
+
+        render.assert_not_called()
+        self.assertNotEqual(first, second)
+        self.assertNotEqual(str(cache_path), second)
+        self.assertEqual(Path(first).read_bytes(), Path(second).read_bytes())
+
+        # The label file is its own copy, removing it keeps the cache
+        os.unlink(second)
+        self.assertTrue(cache_path.exists())
+
+    def test_miss_renders(self):
+        """Tests that different settings render a new image"""
+
+        self._create_text_image("Box 1")
+        self.config["rotate"] = 90
+
+        with mock.patch.object(
+            print_text, "try_pil_image_creation", return_value=True
+        ) as render:
+            self._create_text_image("Box 1")
+
+        render.assert_called_once()
+
+
+class TestResolveFontPath(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp = Path(tmp_dir.name)
+
+        patcher = mock.patch.object(
+            print_text, "FONT_CACHE_FILE", self.tmp / "cache" / "fonts.json"
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.match = self.tmp / "DejaVuSans.ttf"
+        self.match.write_bytes(b"not really a font")
+
+        patcher = mock.patch("subprocess.run")
+        self.run = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.run.return_value = mock.Mock(returncode=0, stdout=str(self.match))
+
+    def test_existing_file_is_kept(self):
+        """Tests that a font file that exists is used without fc-match"""
+
+        self.assertEqual(str(self.match), print_text.resolve_font_path(str(self.match)))
+        self.run.assert_not_called()
+
+    def test_match_is_cached(self):
+        """Tests that fc-match only runs once for a missing font"""
+
+        missing = str(self.tmp / "missing" / "DejaVuSans.ttf")
+        self.assertEqual(str(self.match), print_text.resolve_font_path(missing))
+        self.assertEqual(str(self.match), print_text.resolve_font_path(missing))
+
+        self.run.assert_called_once()
+        self.assertEqual("DejaVuSans", self.run.call_args[0][0][-1])
+
+    def test_stale_match_is_looked_up_again(self):
+        """Tests that a cached match that was removed runs fc-match again"""
+
+        print_text.resolve_font_path("DejaVu Sans")
+        self.match.unlink()
+        other = self.tmp / "Other.ttf"
+        other.write_bytes(b"not really a font")
+        self.run.return_value.stdout = str(other)
+
+        self.assertEqual(str(other), print_text.resolve_font_path("DejaVu Sans"))
+        self.assertEqual(2, self.run.call_count)
+
+    def test_no_match_keeps_font(self):
+        """Tests that the configured font is kept when fc-match finds nothing"""
+
+        self.run.return_value = mock.Mock(returncode=1, stdout="")
+
+        self.assertEqual("Nope", print_text.resolve_font_path("Nope"))
+        self.assertFalse(print_text.FONT_CACHE_FILE.exists())
+
+
+class TestReadTexts(unittest.TestCase):
+    def _read_texts(self, texts, stdin):
+        with mock.patch.object(print_text.sys, "stdin", io.StringIO(stdin)):
+            return print_text.read_texts(texts)
+
+    def test_stdin_lines_become_labels(self):
+        """Tests that "-" expands in place into one label per stdin line"""
+
+        self.assertEqual(
+            ["First", "Box 1", "Box 2", "Last"],
+            self._read_texts(["First", "-", "Last"], "Box 1\nBox 2\n"),
+        )
+
+    def test_blank_lines_are_skipped(self):
+        """Tests that blank lines are skipped but label spacing is kept"""
+
+        self.assertEqual(
+            ["  indented", "trailing  "],
+            self._read_texts(["-"], "\n  indented\n   \ntrailing  \n\n"),
+        )
+
+    def test_empty_stdin_is_an_error(self):
+        """Tests that label-text refuses to run without any label text"""
+
+        stderr = io.StringIO()
+        with mock.patch.object(print_text.sys, "argv", ["label-text", "-"]):
+            with mock.patch.object(print_text.sys, "stdin", io.StringIO("\n \n")):
+                with contextlib.redirect_stderr(stderr):
+                    with self.assertRaises(SystemExit) as cm:
+                        print_text.main()
+
+        self.assertEqual(2, cm.exception.code)
+        self.assertIn("no label text given on stdin", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@
 
 import unittest
 import logging
+from hashlib import blake2b
 from pathlib import Path
 
 from labelprinter.printer import (
@@ -31,35 +32,41 @@ from labelprinter.printer import (
 logger = logging.getLogger(__name__)
 
 
+def _response_key(message):
+    # Key responses by a short digest so lookups don't rehash the
+    # whole (possibly multi-KB binary) message every time
+    if isinstance(message, str):
+        message = message.encode()
+
+    return blake2b(message, digest_size=16).digest()
+
+
+def _file_key(handle, chunk_size=65536):
+    # Same key as _response_key, but hashed in chunks so the file never
+    # has to be held in memory; sent from the start like Connection does
+    handle.seek(0)
+
+    digest = blake2b(digest_size=16)
+    size = 0
+    for chunk in iter(lambda: handle.read(chunk_size), b""):
+        digest.update(chunk)
+        size += len(chunk)
+
+    return size, digest.digest()
+
+
 class MockConnection(object):
     def __init__(self):
         self._sent = []
         self._responses = {}
         self._last_message = None
+        self._last_key = None
 
     def dump_responses(self):
         logger.debug("Configured responses: %s", self._responses)
 
     def register_response(self, message, response, answer_description):
-        self._responses[message] = (answer_description, response)
-
-    def register_response_from_files(
-        self, file_message, file_response, answer_description
-    ):
-        logger.debug(
-            "Registering message/response pair in mock from files %s and %s",
-            file_message,
-            file_response,
-        )
-
-        # Get the directory of the test file
-        test_dir = Path(__file__).parent
-
-        return self.register_response(
-            (test_dir / file_message).read_text().rstrip(),
-            (test_dir / file_response).read_text().rstrip(),
-            answer_description,
-        )
+        self._responses[_response_key(message)] = (answer_description, response)
 
     def register_binary_response(self, file_message, file_response, answer_description):
         logger.debug(
@@ -71,10 +78,12 @@ class MockConnection(object):
         # Get the directory of the test file
         test_dir = Path(__file__).parent
 
-        return self.register_response(
-            (test_dir / file_message).read_bytes(),
-            (test_dir / file_response).read_text().rstrip(),
+        with open(test_dir / file_message, "rb") as handle:
+            _, key = _file_key(handle)
+
+        self._responses[key] = (
             answer_description,
+            (test_dir / file_response).read_text().rstrip(),
         )
 
     def send_message(self, message):
@@ -85,21 +94,20 @@ class MockConnection(object):
         )
 
         self._last_message = data
+        self._last_key = _response_key(data)
 
     def send_file(self, handle):
-        binary_data = Path(handle.name).read_bytes()
+        size, self._last_key = _file_key(handle)
 
-        logger.info(
-            "Received binary file to send, totalling %s bytes", len(binary_data)
-        )
+        logger.info("Received binary file to send, totalling %s bytes", size)
 
-        self._last_message = binary_data
+        self._last_message = "<binary file of %s bytes>" % size
 
     def get_message(self, long_timeout=False, buffer_size=4096):
         logger.info("Mock has been asked for a response to the last message")
 
-        if self._last_message in self._responses:
-            answer_description, data = self._responses[self._last_message]
+        if self._last_key in self._responses:
+            answer_description, data = self._responses[self._last_key]
 
             logger.info("Returning %s: %s", answer_description, data)
 
@@ -117,6 +125,28 @@ class MockConnection(object):
 
 
 class TestPrinter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The text fixtures don't change during a run, read each one once
+        test_dir = Path(__file__).parent
+
+        cls._fixtures = {
+            path.name: path.read_text().rstrip() for path in test_dir.glob("*.bin")
+        }
+
+    def _printer(self, printer=None):
+        # A fresh mock per assertion unless a test chains several on one
+        # printer (e.g. lock, print, release)
+        if printer is None:
+            printer = LabelPrinter(MockConnection())
+
+        return printer
+
+    def _register_response(self, printer, file_message, file_response, description):
+        printer._connection.register_response(
+            self._fixtures[file_message], self._fixtures[file_response], description
+        )
+
     def test_00_init(self):
         """Tests instantiating a LabelPrinter object"""
 
@@ -134,11 +164,11 @@ class TestPrinter(unittest.TestCase):
         tape_type,
         tape_length_initial,
         tape_width,
-        printer=LabelPrinter(MockConnection()),
+        printer=None,
     ):
-        printer._connection.register_response_from_files(
-            message, response, answer_description
-        )
+        printer = self._printer(printer)
+
+        self._register_response(printer, message, response, answer_description)
 
         result = printer.get_configuration()
 
@@ -182,11 +212,11 @@ class TestPrinter(unittest.TestCase):
         print_job_stage,
         print_job_error,
         tape_length_remaining,
-        printer=LabelPrinter(MockConnection()),
+        printer=None,
     ):
-        printer._connection.register_response_from_files(
-            message, response, answer_description
-        )
+        printer = self._printer(printer)
+
+        self._register_response(printer, message, response, answer_description)
 
         result = printer.get_status()
 
@@ -245,11 +275,11 @@ class TestPrinter(unittest.TestCase):
         operation,
         job_number,
         code,
-        printer=LabelPrinter(MockConnection()),
+        printer=None,
     ):
-        printer._connection.register_response_from_files(
-            message, response, answer_description
-        )
+        printer = self._printer(printer)
+
+        self._register_response(printer, message, response, answer_description)
 
         result = printer.lock()
 
@@ -273,11 +303,11 @@ class TestPrinter(unittest.TestCase):
         answer_description,
         operation,
         job_number,
-        printer=LabelPrinter(MockConnection()),
+        printer=None,
     ):
-        printer._connection.register_response_from_files(
-            message, response, answer_description
-        )
+        printer = self._printer(printer)
+
+        self._register_response(printer, message, response, answer_description)
 
         result = printer.release(job_number)
 
@@ -306,10 +336,12 @@ class TestPrinter(unittest.TestCase):
         image_description,
         mode,
         cut,
-        printer=LabelPrinter(MockConnection()),
+        printer=None,
     ):
-        printer._connection.register_response_from_files(
-            setup_message, setup_response, setup_description
+        printer = self._printer(printer)
+
+        self._register_response(
+            printer, setup_message, setup_response, setup_description
         )
         printer._connection.register_binary_response(
             image, image_response, image_description
@@ -357,11 +389,11 @@ class TestPrinter(unittest.TestCase):
         image_description,
         mode,
         cut,
-        printer=LabelPrinter(MockConnection()),
+        printer=None,
     ):
-        printer._connection.register_response_from_files(
-            lock_message, lock_response, lock_description
-        )
+        printer = self._printer(printer)
+
+        self._register_response(printer, lock_message, lock_response, lock_description)
 
         self._assert_lock_status(
             lock_message,
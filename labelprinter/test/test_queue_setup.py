@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for creating and removing the CUPS queue over pycups
+
+pycups is replaced by a fake, so these run anywhere.
+"""
+
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from labelprinter import queue_setup
+
+QUEUE = "Q"
+
+
+class FakeIPPError(Exception):
+    pass
+
+
+class FakeCupsConnection(object):
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def _record(self, name, *args, **kwargs):
+        if self.fail:
+            raise FakeIPPError(1, "Forbidden")
+        self.calls.append((name, args, kwargs))
+
+    def addPrinter(self, name, **kwargs):
+        self._record("addPrinter", name, **kwargs)
+
+    def setPrinterShared(self, name, shared):
+        self._record("setPrinterShared", name, shared)
+
+    def acceptJobs(self, name):
+        self._record("acceptJobs", name)
+
+    def disablePrinter(self, name):
+        self._record("disablePrinter", name)
+
+    def deletePrinter(self, name):
+        self._record("deletePrinter", name)
+
+
+class TestQueueSetup(unittest.TestCase):
+    def _patch_cups(self, conn):
+        fake_cups = mock.Mock(Connection=lambda: conn, IPPError=FakeIPPError)
+        patcher = mock.patch.object(queue_setup, "import_cups", return_value=fake_cups)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # pycups must be enough, the command-line tools are never run
+        patcher = mock.patch.object(
+            queue_setup.subprocess, "run", side_effect=AssertionError
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_create_over_ipp(self):
+        """Tests that the queue is created accepting jobs but disabled"""
+
+        conn = FakeCupsConnection()
+        self._patch_cups(conn)
+
+        self.assertTrue(queue_setup.create_cups_queue(QUEUE, "Desc", "Loc"))
+
+        self.assertEqual(
+            [
+                (
+                    "addPrinter",
+                    (QUEUE,),
+                    {"device": "file:///dev/null", "info": "Desc", "location": "Loc"},
+                ),
+                ("setPrinterShared", (QUEUE, False), {}),
+                ("acceptJobs", (QUEUE,), {}),
+                ("disablePrinter", (QUEUE,), {}),
+            ],
+            conn.calls,
+        )
+
+    def test_remove_over_ipp(self):
+        """Tests that the queue is deleted over IPP"""
+
+        conn = FakeCupsConnection()
+        self._patch_cups(conn)
+
+        self.assertTrue(queue_setup.remove_cups_queue(QUEUE))
+        self.assertEqual([("deletePrinter", (QUEUE,), {})], conn.calls)
+
+    def test_ipp_error_fails(self):
+        """Tests that an IPP error is reported rather than raised"""
+
+        self._patch_cups(FakeCupsConnection(fail=True))
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertFalse(queue_setup.create_cups_queue(QUEUE, "Desc", "Loc"))
+            self.assertFalse(queue_setup.remove_cups_queue(QUEUE))
+
+        self.assertIn("Error creating CUPS queue", stderr.getvalue())
+        self.assertIn("Error removing CUPS queue", stderr.getvalue())
+
+    def test_falls_back_to_lpadmin(self):
+        """Tests that the command-line tools are used without pycups"""
+
+        with mock.patch.object(queue_setup, "import_cups", return_value=None):
+            with mock.patch.object(queue_setup.subprocess, "run") as run:
+                self.assertTrue(queue_setup.remove_cups_queue(QUEUE))
+
+        self.assertEqual(["lpadmin", "-x", QUEUE], run.call_args[0][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
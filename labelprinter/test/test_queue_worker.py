@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Tests for the CUPS queue worker's busy backoff, held-job cache,
+printer connection reuse and label-raw subprocess
+
+pycups and the printer are replaced by fakes, so these run anywhere.
+"""
+
+import contextlib
+import io
+import subprocess
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from labelprinter import connection, queue_worker
+from labelprinter.test.test_printer import MockConnection
+
+QUEUE = "Q"
+
+
+class FakeIPPError(Exception):
+    pass
+
+
+class FakeCupsConnection(object):
+    def __init__(self):
+        self.jobs = {}
+        self.events = []
+        self.get_jobs_calls = 0
+        self.canceled = []
+
+    def add_job(self, job_id):
+        self.jobs[job_id] = {
+            "job-id": job_id,
+            "job-state": 5,  # held
+            "job-printer-uri": f"ipp://localhost/printers/{QUEUE}",
+            "document-name-supplied": f"{job_id}.jpg",
+        }
+
+    def add_event(self, job_id):
+        self.events.append(
+            {"notify-sequence-number": len(self.events) + 1, "notify-job-id": job_id}
+        )
+
+    def getJobs(self, which_jobs, my_jobs, requested_attributes):
+        self.get_jobs_calls += 1
+        return {job_id: dict(info) for job_id, info in self.jobs.items()}
+
+    def cancelJob(self, job_id, purge_job=False):
+        self.canceled.append(job_id)
+        del self.jobs[job_id]
+        self.add_event(job_id)
+
+    def createSubscription(self, uri, events):
+        return 1
+
+    def getNotifications(self, subscription_ids, sequence_numbers):
+        return {"events": self.events[sequence_numbers[0] - 1 :]}
+
+    def cancelSubscription(self, subscription_id):
+        pass
+
+
+class FakePrinterConnection(MockConnection):
+    """MockConnection that the printer can drop like its socket"""
+
+    RESPONSES = (
+        ("getconfig.bin", "getconfig.resp.bin", "configuration XML"),
+        ("getstatus.bin", "getstatus.resp.bin", "status XML (idle)"),
+        ("printsetup.bin", "printsetup.resp.bin", "print setup XML"),
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.alive = True
+        self.closed = False
+        self.files_sent = 0
+        # Reset the next request, or the one answering the next image
+        self.reset_next = False
+        self.reset_after_file = False
+
+        test_dir = Path(__file__).parent
+        for message, response, description in self.RESPONSES:
+            self.register_response(
+                (test_dir / message).read_text().rstrip(),
+                (test_dir / response).read_text().rstrip(),
+                description,
+            )
+        self.register_binary_response("image.jpg", "image.resp.bin", "image data")
+
+    def is_alive(self):
+        return self.alive
+
+    def close(self):
+        self.closed = True
+
+    def send_file(self, handle):
+        super().send_file(handle)
+        self.files_sent += 1
+        if self.reset_after_file:
+            self.reset_next = True
+
+    def get_message(self, long_timeout=False, buffer_size=4096):
+        if self.reset_next:
+            self.reset_next = False
+            raise ConnectionResetError(104, "Connection reset by peer")
+        return super().get_message(long_timeout, buffer_size)
+
+
+class TestPrinterConnection(unittest.TestCase):
+    def setUp(self):
+        # Printing never talks to CUPS
+        with mock.patch.object(queue_worker, "import_cups"):
+            self.worker = queue_worker.QueueWorker(
+                QUEUE, verbose=True, config={"host": "printer"}
+            )
+
+        self.connections = []
+
+        def connect(host, port):
+            self.connections.append(FakePrinterConnection())
+            return self.connections[-1]
+
+        patcher = mock.patch.object(connection, "Connection", connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.job_file = Path(__file__).parent / "image.jpg"
+
+    def _print(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result = self.worker._print_in_process(self.job_file)
+        return result, output.getvalue()
+
+    def test_connection_is_reused(self):
+        """Tests that consecutive jobs share one printer connection"""
+
+        self.assertEqual((True, ""), self._print()[0])
+        self.assertEqual((True, ""), self._print()[0])
+
+        self.assertEqual(1, len(self.connections))
+        self.assertEqual(2, self.connections[0].files_sent)
+
+    def test_dropped_idle_connection_reconnects(self):
+        """Tests that a connection the printer closed is replaced"""
+
+        self._print()
+        self.connections[0].alive = False
+
+        result, output = self._print()
+
+        self.assertEqual((True, ""), result)
+        self.assertIn("Printer connection was closed, reconnecting", output)
+        self.assertEqual(2, len(self.connections))
+        self.assertTrue(self.connections[0].closed)
+        self.assertEqual(1, self.connections[1].files_sent)
+
+    def test_reset_on_status_probe_is_retried_once(self):
+        """Tests that a reset before anything was sent retries on a new one"""
+
+        self._print()
+        self.connections[0].reset_next = True
+
+        result, output = self._print()
+
+        self.assertEqual((True, ""), result)
+        self.assertIn("Printer connection was reset, reconnecting", output)
+        self.assertEqual(2, len(self.connections))
+        self.assertEqual(1, self.connections[0].files_sent)
+        self.assertEqual(1, self.connections[1].files_sent)
+
+    def test_reset_after_image_is_not_retried(self):
+        """Tests that a reset once the image was sent fails the job"""
+
+        self._print()
+        self.connections[0].reset_after_file = True
+
+        result, output = self._print()
+
+        self.assertEqual(
+            (False, "ConnectionResetError: [Errno 104] Connection reset by peer"),
+            result,
+        )
+        # The label may have printed, sending it again could print it twice
+        self.assertEqual(1, len(self.connections))
+        self.assertEqual(2, self.connections[0].files_sent)
+        self.assertTrue(self.connections[0].closed)
+
+
+class TestRunWithOutputTail(unittest.TestCase):
+    def _run(self, script, timeout=10):
+        return queue_worker.run_with_output_tail(
+            (sys.executable, "-c", script), timeout=timeout
+        )
+
+    def test_output_is_truncated_to_tail(self):
+        """Tests that only the last OUTPUT_TAIL_BYTES of each pipe are kept"""
+
+        size = queue_worker.OUTPUT_TAIL_BYTES
+        returncode, stdout, stderr = self._run(
+            "import sys\n"
+            f"sys.stdout.write('x' * {3 * size} + 'END')\n"
+            f"sys.stderr.write('y' * {size} + 'ERR')\n"
+            "sys.exit(3)"
+        )
+
+        self.assertEqual(3, returncode)
+        self.assertEqual(size, len(stdout))
+        self.assertTrue(stdout.endswith("xEND"))
+        self.assertEqual(size, len(stderr))
+        self.assertTrue(stderr.endswith("yERR"))
+
+    def test_timeout_kills_child(self):
+        """Tests that a child running past the timeout is killed"""
+
+        for script in (
+            "import time; time.sleep(60)",
+            # Output closed, so only the final wait can time out
+            "import os, time; os.close(1); os.close(2); time.sleep(60)",
+        ):
+            with self.subTest(script=script):
+                start = time.monotonic()
+                with self.assertRaises(subprocess.TimeoutExpired):
+                    self._run(script, timeout=0.5)
+                self.assertLess(time.monotonic() - start, 10)
+
+    def test_label_raw_error_prefers_stderr(self):
+        """Tests that label-raw's stderr is reported, else its stdout"""
+
+        with mock.patch.object(queue_worker, "import_cups"):
+            worker = queue_worker.QueueWorker(
+                QUEUE, config={"host": "printer"}, use_subprocess=True
+            )
+
+        for script, expected in (
+            ("import sys; print('out'); sys.exit('err')", (False, "err")),
+            ("import sys; print('out'); sys.exit(1)", (False, "out")),
+            ("print('PRINT OK')", (True, "PRINT OK")),
+        ):
+            with self.subTest(script=script):
+                # The job file is passed as an argument and ignored here
+                worker._cmd_prefix = (sys.executable, "-c", script)
+                self.assertEqual(expected, worker._print_with_label_raw("job.jpg"))
+
+
+class StopWorker(Exception):
+    """Raised by the fake wait to end the daemon loop"""
+
+
+class TestQueueWorker(unittest.TestCase):
+    def setUp(self):
+        self.conn = FakeCupsConnection()
+        fake_cups = mock.Mock(Connection=lambda: self.conn, IPPError=FakeIPPError)
+
+        with mock.patch.object(queue_worker, "import_cups", return_value=fake_cups):
+            self.worker = queue_worker.QueueWorker(QUEUE, config={"host": "printer"})
+
+        self.worker.prepare_job = lambda job_id, job_info: None
+
+        self.printed = []
+        self.failed = []
+        self.worker.mark_job_failed = lambda job_id, error: self.failed.append(
+            (job_id, error)
+        )
+
+        # Busy waits advance a fake clock instead of sleeping
+        self.clock = 0.0
+        self.waits = []
+        self.on_wait = None
+        patcher = mock.patch.object(queue_worker, "clock", lambda: self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.worker.wait_for_job_events = self._wait
+
+    def _wait(self, poll_interval, timeout=None):
+        if timeout is None:
+            # Nothing left to retry, the worker would idle from here
+            raise StopWorker()
+
+        self.waits.append(round(timeout))
+        if len(self.waits) > 20:
+            self.fail(f"Worker keeps waiting: {self.waits[:20]}")
+        if self.on_wait:
+            self.on_wait(len(self.waits))
+        self.clock += timeout
+
+    def _stub_print_job(self, busy_attempts):
+        # busy_attempts maps job IDs to how many attempts find the printer busy
+        def print_job(job_id, job_info, prepared=None):
+            self.printed.append(job_id)
+            if busy_attempts.get(job_id, 0) > 0:
+                busy_attempts[job_id] -= 1
+                return (False, "Printer did not become idle", True)
+            return (True, None, False)
+
+        self.worker.print_job = print_job
+
+    def _run_daemon(self, retry_delay=30):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            with self.assertRaises(StopWorker):
+                self.worker.process_queue(retry_delay=retry_delay, poll_interval=5)
+        return output.getvalue()
+
+    def test_busy_delay_doubles_up_to_cap(self):
+        """Tests that a busy job's retry delay doubles up to the backoff cap"""
+
+        self.conn.add_job(1)
+        self._stub_print_job({1: 5})
+
+        self._run_daemon(retry_delay=30)
+
+        # Capped at max(8 * retry_delay, 300)
+        self.assertEqual([30, 60, 120, 240, 300], self.waits)
+        self.assertEqual([1] * 6, self.printed)
+        self.assertEqual([1], self.conn.canceled)
+        self.assertEqual([], self.failed)
+
+    def test_busy_job_fails_after_max_retries(self):
+        """Tests that a job still busy after MAX_BUSY_RETRIES is marked failed"""
+
+        self.conn.add_job(1)
+        self._stub_print_job({1: 100})
+
+        self._run_daemon(retry_delay=1)
+
+        self.assertEqual([1, 2, 4, 8, 16, 32, 64, 128], self.waits)
+        self.assertEqual([1] * 9, self.printed)
+        self.assertEqual([(1, "Printer still busy after 8 retries")], self.failed)
+        # Failed jobs stay queued for the user to look at
+        self.assertEqual([], self.conn.canceled)
+
+    def test_busy_job_leaving_queue_is_dropped(self):
+        """Tests that a busy job canceled elsewhere no longer holds a retry"""
+
+        self.conn.add_job(1)
+        self.conn.add_job(2)
+        self._stub_print_job({1: 100, 2: 2})
+
+        def cancel_job_1(wait_number):
+            if wait_number == 1:
+                del self.conn.jobs[1]
+                self.conn.add_event(1)
+
+        self.on_wait = cancel_job_1
+
+        output = self._run_daemon(retry_delay=30)
+
+        self.assertEqual([30, 60], self.waits)
+        self.assertIn("Waiting 30s before retrying 2 busy job(s)", output)
+        self.assertIn("Waiting 60s before retrying 1 busy job(s)", output)
+        # Job 1 isn't attempted again once it left the queue
+        self.assertEqual([1, 2, 2, 2], self.printed)
+        self.assertEqual([2], self.conn.canceled)
+
+    def test_own_cancel_keeps_job_list(self):
+        """Tests that canceling our own printed jobs doesn't re-list the queue"""
+
+        self.worker._subscribe()
+        self.conn.add_job(1)
+        self.conn.add_job(2)
+
+        jobs = self.worker.get_held_jobs()
+        self.assertEqual([1, 2], [job_id for job_id, _ in jobs])
+
+        self.worker.mark_job_completed(1)
+        jobs = self.worker.get_held_jobs()
+        self.assertEqual([2], [job_id for job_id, _ in jobs])
+        self.assertEqual(1, self.conn.get_jobs_calls)
+
+        # A job submitted elsewhere does invalidate the cached list
+        self.conn.add_job(3)
+        self.conn.add_event(3)
+        jobs = self.worker.get_held_jobs()
+        self.assertEqual([2, 3], [job_id for job_id, _ in jobs])
+        self.assertEqual(2, self.conn.get_jobs_calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
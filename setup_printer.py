@@ -3,19 +3,28 @@
 Setup script to detect and save Brother VC-500W printer IP address to config
 """
 
+import argparse
+import ipaddress
 import json
 import os
+import queue
+import socket
 import subprocess
 import sys
+import threading
+import time
 
 DEFAULT_HOSTNAME = "VC-500W4188.local"
-AVAHI_TIMEOUT = 10
+# Per-lookup timeout; a printer that is on answers mDNS within a second
+AVAHI_TIMEOUT = 5
+PRINTER_PORT = 9100
+# A printer on the local network accepts a connection well within this
+PROBE_TIMEOUT = 0.5
 
 
-def detect_printer():
-    """Detect the printer IP address using avahi-resolve
+def resolve_with_avahi():
+    """Resolve the printer hostname using avahi-resolve
 
-    Returns the IP address (e.g., "192.168.1.100") or None if not found.
     avahi-resolve output format: "hostname.local\t192.168.1.100"
     """
     try:
@@ -36,6 +45,48 @@ def detect_printer():
         return None
 
 
+def resolve_with_getaddrinfo():
+    """Resolve the printer hostname using the system resolver (nss-mdns)"""
+    try:
+        addr_info = socket.getaddrinfo(
+            DEFAULT_HOSTNAME, None, socket.AF_INET, socket.SOCK_STREAM
+        )
+        return addr_info[0][4][0] if addr_info else None
+    except OSError:
+        return None
+
+
+def detect_printer():
+    """Detect the printer IP address
+
+    Runs avahi-resolve and the system resolver at the same time and
+    returns the first address found, so a missing avahi-daemon or
+    nss-mdns doesn't cost a full timeout before the other one is tried.
+
+    Returns the IP address (e.g., "192.168.1.100") or None if not found.
+    """
+    lookups = (resolve_with_avahi, resolve_with_getaddrinfo)
+    results = queue.Queue()
+
+    def run(lookup):
+        results.put(lookup())
+
+    # Daemon threads, so a lookup that is still running doesn't hold up
+    # exiting once the other one found the printer
+    for lookup in lookups:
+        threading.Thread(target=run, args=(lookup,), daemon=True).start()
+
+    deadline = time.monotonic() + AVAHI_TIMEOUT
+    for _ in lookups:
+        try:
+            ip_address = results.get(timeout=max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            return None
+        if ip_address:
+            return ip_address
+    return None
+
+
 def get_config_path():
     """Get the path to the configuration file"""
     config_dir = os.path.expanduser("~/.config/labelprinter")
@@ -55,6 +106,26 @@ def load_existing_config(config_file):
         return {}
 
 
+def check_configured_printer(config_file):
+    """Check whether the printer still answers at the configured address
+
+    Returns the configured IP address if the printer accepts a
+    connection on it, None otherwise. Hostnames are not checked, since
+    replacing them with an IP address is what this script is for.
+    """
+    host = load_existing_config(config_file).get("host")
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return None
+
+    try:
+        with socket.create_connection((host, PRINTER_PORT), timeout=PROBE_TIMEOUT):
+            return host
+    except OSError:
+        return None
+
+
 def save_config(ip_address):
     """Save the IP address to the config file"""
     config_file = get_config_path()
@@ -63,13 +134,32 @@ def save_config(ip_address):
     config = load_existing_config(config_file)
     config["host"] = ip_address
 
-    with open(config_file, "w") as f:
+    # Write next to the config and rename it into place like label-text
+    # does, so an interrupted write never leaves a truncated config
+    tmp_file = config_file + ".tmp"
+    with open(tmp_file, "w") as f:
         json.dump(config, f, indent=2)
+    os.replace(tmp_file, config_file)
 
     print(f"✅ Saved printer IP address to config: {ip_address}")
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="detect the printer even if it answers at the configured address",
+    )
+    args = parser.parse_args()
+
+    if not args.force:
+        ip_address = check_configured_printer(get_config_path())
+        if ip_address:
+            print(f"✅ Printer still answers at configured address {ip_address}")
+            print("   Run with --force to detect it again")
+            return 0
+
     print("🔍 Detecting Brother VC-500W printer...")
 
     ip_address = detect_printer()